@@ -5,44 +5,64 @@
 //! had defined locally. Every reader returns `None` past the end of the slice
 //! rather than panicking, so callers can use `?`.
 
+/// Copies the `N` bytes at `offset` into an array, or `None` if they run past
+/// the end of `data` (an `offset` near `usize::MAX` is out of bounds, not an
+/// overflow). Every scalar reader below is this one checked copy plus a
+/// `from_le_bytes`.
+fn read_array<const N: usize>(data: &[u8], offset: usize) -> Option<[u8; N]> {
+    data.get(offset..offset.checked_add(N)?)?.try_into().ok()
+}
+
 /// Reads a little-endian `u16` at `offset`, or `None` if out of bounds.
 pub fn read_u16_le(data: &[u8], offset: usize) -> Option<u16> {
-    data.get(offset..offset + 2)?
-        .try_into()
-        .ok()
-        .map(u16::from_le_bytes)
+    read_array(data, offset).map(u16::from_le_bytes)
 }
 
 /// Reads a little-endian `u32` at `offset`, or `None` if out of bounds.
 pub fn read_u32_le(data: &[u8], offset: usize) -> Option<u32> {
-    data.get(offset..offset + 4)?
-        .try_into()
-        .ok()
-        .map(u32::from_le_bytes)
+    read_array(data, offset).map(u32::from_le_bytes)
 }
 
 /// Reads a little-endian `i16` at `offset`, or `None` if out of bounds.
 pub fn read_i16_le(data: &[u8], offset: usize) -> Option<i16> {
-    data.get(offset..offset + 2)?
-        .try_into()
-        .ok()
-        .map(i16::from_le_bytes)
+    read_array(data, offset).map(i16::from_le_bytes)
 }
 
 /// Reads a little-endian `i32` at `offset`, or `None` if out of bounds.
 pub fn read_i32_le(data: &[u8], offset: usize) -> Option<i32> {
-    data.get(offset..offset + 4)?
-        .try_into()
-        .ok()
-        .map(i32::from_le_bytes)
+    read_array(data, offset).map(i32::from_le_bytes)
 }
 
 /// Reads a little-endian IEEE-754 `f64` at `offset`, or `None` if out of bounds.
 pub fn read_f64_le(data: &[u8], offset: usize) -> Option<f64> {
-    data.get(offset..offset + 8)?
-        .try_into()
-        .ok()
-        .map(f64::from_le_bytes)
+    read_array(data, offset).map(f64::from_le_bytes)
+}
+
+/// Reads `N` consecutive little-endian `i32`s starting at `offset`, or `None`
+/// if any of them is out of bounds.
+///
+/// Fixed-layout primitive records store their coordinates as a contiguous run
+/// of `i32` fields; reading the run with one bounds check replaces `N`
+/// separately checked [`read_i32_le`] calls.
+pub fn read_i32s_le<const N: usize>(data: &[u8], offset: usize) -> Option<[i32; N]> {
+    let bytes = data.get(offset..offset.checked_add(N * 4)?)?;
+    let mut out = [0; N];
+    for (value, chunk) in out.iter_mut().zip(bytes.chunks_exact(4)) {
+        *value = i32::from_le_bytes(chunk.try_into().ok()?);
+    }
+    Some(out)
+}
+
+/// Reads `N` consecutive little-endian IEEE-754 `f64`s starting at `offset`, or
+/// `None` if any of them is out of bounds. The `f64` counterpart of
+/// [`read_i32s_le`] (e.g. an `(x, y)` vertex pair).
+pub fn read_f64s_le<const N: usize>(data: &[u8], offset: usize) -> Option<[f64; N]> {
+    let bytes = data.get(offset..offset.checked_add(N * 8)?)?;
+    let mut out = [0.0; N];
+    for (value, chunk) in out.iter_mut().zip(bytes.chunks_exact(8)) {
+        *value = f64::from_le_bytes(chunk.try_into().ok()?);
+    }
+    Some(out)
 }
 
 #[cfg(test)]
@@ -59,11 +79,32 @@ mod tests {
         assert_eq!(read_f64_le(&d, 0), Some(f64::from_le_bytes(d)));
     }
 
+    #[test]
+    fn reads_fixed_runs() {
+        let mut d = Vec::new();
+        for v in [1i32, -2, 3] {
+            d.extend_from_slice(&v.to_le_bytes());
+        }
+        assert_eq!(read_i32s_le::<3>(&d, 0), Some([1, -2, 3]));
+        assert_eq!(read_i32s_le::<2>(&d, 4), Some([-2, 3]));
+        assert_eq!(read_i32s_le::<3>(&d, 4), None);
+
+        let mut f = Vec::new();
+        for v in [1.5f64, -2.25] {
+            f.extend_from_slice(&v.to_le_bytes());
+        }
+        assert_eq!(read_f64s_le::<2>(&f, 0), Some([1.5, -2.25]));
+        assert_eq!(read_f64s_le::<2>(&f, 1), None);
+        assert_eq!(read_f64s_le::<1>(&f, usize::MAX), None);
+    }
+
     #[test]
     fn out_of_bounds_is_none() {
         let d = [0x01, 0x02];
         assert_eq!(read_u32_le(&d, 0), None);
         assert_eq!(read_u16_le(&d, 1), None);
         assert_eq!(read_f64_le(&d, 0), None);
+        // An offset near usize::MAX is out of bounds rather than an overflow.
+        assert_eq!(read_u32_le(&d, usize::MAX - 1), None);
     }
 }
@@ -240,6 +240,21 @@ pub(crate) fn open_ole<R: std::io::Read + std::io::Seek>(
         .map_err(|e| AltiumError::invalid_ole(format!("Failed to open OLE file: {e}")))
 }
 
+/// Reads a library file fully into memory for [`open_ole`].
+///
+/// The compound-file reader follows each stream's sector chain through the
+/// FAT, and those sectors are scattered across the file, so reading straight
+/// from a `File` costs a seek plus a small read syscall per 512-byte sector.
+/// One sequential read up front turns all of that into in-memory seeks.
+/// Libraries are small enough (even with embedded STEP models) to hold whole.
+pub(crate) fn read_file_to_cursor(
+    path: &std::path::Path,
+) -> AltiumResult<std::io::Cursor<Vec<u8>>> {
+    std::fs::read(path)
+        .map(std::io::Cursor::new)
+        .map_err(|e| AltiumError::file_read(path, e))
+}
+
 /// Creates a stream at `path` and writes `data` to it. The emitted stream
 /// content is exactly `data`, so output is byte-identical to a hand-written
 /// `create_stream` + `write_all`.
@@ -271,9 +286,28 @@ where
         return None;
     }
     let mut stream = cfb.open_stream(path).ok()?;
-    let mut data = Vec::new();
-    std::io::Read::read_to_end(&mut stream, &mut data).ok()?;
-    Some(data)
+    read_stream_to_end(&mut stream).ok()
+}
+
+/// Largest capacity [`read_stream_to_end`] reserves up front from a stream's
+/// declared length (16 MiB). Bigger streams still read in full; they just grow
+/// past this point, so a corrupt length cannot force a huge allocation.
+const MAX_STREAM_PREALLOC: usize = 16 * 1024 * 1024;
+
+/// Reads an open OLE stream fully into a `Vec` sized from its declared length.
+///
+/// A plain `read_to_end` into an empty `Vec` reallocates and copies its way up
+/// to the stream size; multi-megabyte footprint `Data` streams paid for that
+/// on every read. Reserving the length once makes it a single allocation.
+pub(crate) fn read_stream_to_end<F>(stream: &mut cfb::Stream<F>) -> std::io::Result<Vec<u8>>
+where
+    F: std::io::Read + std::io::Seek,
+{
+    let hint = usize::try_from(stream.len())
+        .map_or(MAX_STREAM_PREALLOC, |len| len.min(MAX_STREAM_PREALLOC));
+    let mut data = Vec::with_capacity(hint);
+    std::io::Read::read_to_end(stream, &mut data)?;
+    Ok(data)
 }
 
 /// Creates an OLE storage at `path`, wrapping failures as `invalid_ole`.
@@ -327,21 +361,36 @@ pub(crate) fn save_atomic(
 /// keys (values kept verbatim). Segments that are empty or lack `=` are skipped;
 /// duplicate keys keep the last value. Used by `SchLib`'s text/property records.
 pub(crate) fn parse_pipe_params(text: &str) -> std::collections::HashMap<String, String> {
-    let mut map = std::collections::HashMap::new();
+    let mut map = std::collections::HashMap::with_capacity(pipe_field_count(text));
     for part in text.split('|') {
         if let Some((key, value)) = part.split_once('=') {
-            map.insert(key.to_lowercase(), value.to_string());
+            // Keys are ASCII in practice; the ASCII fold gives the same result
+            // without the full Unicode case-mapping pass.
+            let key = if key.is_ascii() {
+                key.to_ascii_lowercase()
+            } else {
+                key.to_lowercase()
+            };
+            map.insert(key, value.to_string());
         }
     }
     map
 }
 
+/// Upper bound on the `KEY=VALUE` fields in a pipe-delimited record, used to
+/// size the parsed map once. A `FileHeader` carries a `LIBREF{N}` (and
+/// `COMPDESCR{N}`) pair per component, so growing the map incrementally would
+/// rehash repeatedly on large libraries.
+fn pipe_field_count(text: &str) -> usize {
+    text.bytes().filter(|&b| b == b'|').count() + 1
+}
+
 /// Like [`parse_pipe_params`] but preserves key case verbatim and trims trailing
 /// NUL padding (then surrounding whitespace) from values. `PcbLib` records match
 /// keys in their native UPPERCASE form and pad values with `\0`, neither of which
 /// the lowercasing `parse_pipe_params` handles. Callers look keys up in UPPERCASE.
 pub(crate) fn parse_pipe_params_raw(text: &str) -> std::collections::HashMap<String, String> {
-    let mut map = std::collections::HashMap::new();
+    let mut map = std::collections::HashMap::with_capacity(pipe_field_count(text));
     for part in text.split('|') {
         if let Some((key, value)) = part.split_once('=') {
             map.insert(
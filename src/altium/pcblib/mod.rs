@@ -275,13 +275,25 @@ impl PcbLib {
     /// Returns an error if the file cannot be read or is not a valid `PcbLib`.
     pub fn open(path: impl AsRef<std::path::Path>) -> AltiumResult<Self> {
         let path = path.as_ref();
-        let file = std::fs::File::open(path).map_err(|e| AltiumError::file_read(path, e))?;
+        let reader = crate::altium::read_file_to_cursor(path)?;
 
-        let mut lib = Self::read(file)?;
+        let mut lib = Self::read(reader)?;
         lib.filepath = Some(path.display().to_string());
         Ok(lib)
     }
 
+    /// Reads only the footprint names of a `PcbLib` file, in library order.
+    ///
+    /// Cheaper than [`Self::open`] followed by [`Self::names`]: see
+    /// [`Self::read_names`].
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the file cannot be read or is not a valid `PcbLib`.
+    pub fn open_names(path: impl AsRef<std::path::Path>) -> AltiumResult<Vec<String>> {
+        Self::read_names(crate::altium::read_file_to_cursor(path.as_ref())?)
+    }
+
     /// Saves the library to a file.
     ///
     /// Uses atomic write: writes to a temporary file first, then renames on success.
@@ -6,6 +6,20 @@ use super::{
     reader, AltiumError, AltiumResult, EmbeddedModel, Footprint, LibraryMetadata, Model3D, PcbLib,
     INTERNAL_OLE_ENTRIES,
 };
+use crate::altium::bytes::read_u32_le;
+
+/// Minimum number of footprints each extra parsing thread must have to make
+/// spawning it worthwhile; smaller libraries are parsed on the calling thread.
+const MIN_FOOTPRINTS_PER_THREAD: usize = 8;
+
+/// A footprint's raw streams, read from the compound file ahead of parsing so
+/// the (independent) per-footprint decoding can run off the OLE reader.
+struct FootprintStreams {
+    /// The primitive `Data` stream.
+    data: Option<Vec<u8>>,
+    /// The `UniqueIDPrimitiveInformation/Data` stream.
+    unique_ids: Option<Vec<u8>>,
+}
 
 impl PcbLib {
     /// Reads a `PcbLib` from any reader implementing `Read + Seek`.
@@ -34,52 +48,141 @@ impl PcbLib {
         // Read embedded 3D models if present
         library.models = Self::read_models(&mut cfb);
 
-        // List all entries to find footprint storages
-        let entries: Vec<_> = cfb.walk().map(|e| e.path().to_path_buf()).collect();
+        let storages = Self::footprint_storages(&cfb);
+        let threads = Self::parse_threads(storages.len());
+        library.footprints = if threads == 1 {
+            // Decode each footprint as soon as it is read, so only one raw
+            // `Data` stream is held at a time.
+            Self::read_footprints(
+                &mut cfb,
+                storages,
+                &library.metadata.component_names,
+                |cfb, storage_path, name| {
+                    let (mut footprint, mut streams) =
+                        Self::read_footprint(cfb, storage_path, name)?;
+                    Self::parse_footprint(&mut footprint, &mut streams, &wide_strings);
+                    Ok((footprint, ()))
+                },
+            )
+            .into_iter()
+            .map(|(footprint, ())| footprint)
+            .collect()
+        } else {
+            // Reading needs the compound file mutably, so gather every
+            // footprint's streams first and then decode them in parallel.
+            let footprints = Self::read_footprints(
+                &mut cfb,
+                storages,
+                &library.metadata.component_names,
+                Self::read_footprint,
+            );
+            Self::parse_footprints(footprints, threads, &wide_strings)
+        };
 
-        // Collect footprints with their OLE storage names for later reordering
-        let mut footprints_by_ole_name: std::collections::HashMap<String, Footprint> =
-            std::collections::HashMap::new();
-
-        for entry_path in entries {
-            // Skip non-storage entries and root
-            let path_str = entry_path.to_string_lossy();
-            if path_str == "/" || path_str.is_empty() {
-                continue;
-            }
+        // Populate model_3d from component_bodies for backward compatibility
+        library.populate_model_3d_from_component_bodies();
 
-            // Check if this is a component storage (has a Data stream)
-            let data_path = entry_path.join("Data");
-            if cfb.is_stream(&data_path) {
-                let component_name = entry_path
-                    .file_name()
-                    .map(|n| n.to_string_lossy().to_string())
-                    .unwrap_or_default();
+        tracing::info!(count = library.footprints.len(), "Read PcbLib");
+
+        Ok(library)
+    }
+
+    /// Reads only the footprint names of a `PcbLib`, in library order.
+    ///
+    /// This is the listing path: it validates the `FileHeader`, takes the
+    /// component order from `Library/Data` and reads each footprint's small
+    /// `Parameters` stream for its canonical name. The primitive `Data`
+    /// stream is only drained (so a footprint whose stream cannot be read is
+    /// skipped, as [`Self::read`] skips it), never buffered or decoded, and
+    /// the `WideStrings` and embedded-model streams are not touched. The
+    /// names and their order match [`Self::names`] after a full read.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the file cannot be parsed.
+    pub fn read_names(reader: impl std::io::Read + std::io::Seek) -> AltiumResult<Vec<String>> {
+        let mut cfb = crate::altium::open_ole(reader)?;
+
+        let mut metadata = Self::read_file_header(&mut cfb)?;
+        Self::read_library_data(&mut cfb, &mut metadata);
+
+        let storages = Self::footprint_storages(&cfb);
+        let footprints = Self::read_footprints(
+            &mut cfb,
+            storages,
+            &metadata.component_names,
+            Self::read_footprint_name,
+        );
+        Ok(footprints
+            .into_iter()
+            .map(|(footprint, ())| footprint.name)
+            .collect())
+    }
+
+    /// Finds the footprint storages in one directory walk, returning each
+    /// storage's path and OLE name.
+    ///
+    /// Each is the parent of a `Data` stream, so collect those parents rather
+    /// than probing every entry for a `Data` child (a second directory lookup
+    /// per entry). The root and the internal storages that also carry a
+    /// `Data` stream are left out, so the result holds one entry per
+    /// footprint.
+    fn footprint_storages<F: std::io::Read + std::io::Seek>(
+        cfb: &cfb::CompoundFile<F>,
+    ) -> Vec<(std::path::PathBuf, String)> {
+        // Compound-file names compare case-insensitively, as `is_stream` did.
+        cfb.walk()
+            .filter(|e| e.is_stream() && e.name().eq_ignore_ascii_case("Data"))
+            .filter_map(|e| {
+                // The root has no file name (a top-level `Data` stream is
+                // not a footprint)
+                let storage_path = e.path().parent()?;
+                let component_name = storage_path.file_name()?.to_string_lossy().to_string();
 
                 // Filter out internal OLE storage entries (not actual footprints)
                 let is_internal = INTERNAL_OLE_ENTRIES
                     .iter()
                     .any(|&entry| component_name == entry);
 
-                if !component_name.is_empty() && !is_internal {
-                    // Read the component data
-                    match Self::read_footprint(
-                        &mut cfb,
-                        &entry_path,
-                        &component_name,
-                        &wide_strings,
-                    ) {
-                        Ok(footprint) => {
-                            footprints_by_ole_name.insert(component_name.clone(), footprint);
-                        }
-                        Err(e) => {
-                            tracing::warn!(
-                                component = %component_name,
-                                error = %e,
-                                "Failed to read footprint, skipping"
-                            );
-                        }
-                    }
+                (!component_name.is_empty() && !is_internal)
+                    .then(|| (storage_path.to_path_buf(), component_name))
+            })
+            .collect()
+    }
+
+    /// Reads each of `storages` with `read_one` and returns the footprints in
+    /// `component_names` (`FileHeader`/`Library/Data`) order, followed by any
+    /// storages the header does not list. A footprint that fails to read is
+    /// logged and skipped.
+    ///
+    /// `read_one` returns the footprint alongside whatever else the caller
+    /// needs from the storage (e.g. its raw streams for later parsing).
+    fn read_footprints<F: std::io::Read + std::io::Seek, T>(
+        cfb: &mut cfb::CompoundFile<F>,
+        storages: Vec<(std::path::PathBuf, String)>,
+        component_names: &[String],
+        mut read_one: impl FnMut(
+            &mut cfb::CompoundFile<F>,
+            &std::path::Path,
+            &str,
+        ) -> AltiumResult<(Footprint, T)>,
+    ) -> Vec<(Footprint, T)> {
+        // Collect footprints with their OLE storage names for later reordering
+        let mut footprints_by_ole_name: std::collections::HashMap<String, (Footprint, T)> =
+            std::collections::HashMap::with_capacity(storages.len());
+
+        for (entry_path, component_name) in storages {
+            // Read the component data
+            match read_one(cfb, &entry_path, &component_name) {
+                Ok(footprint) => {
+                    footprints_by_ole_name.insert(component_name, footprint);
+                }
+                Err(e) => {
+                    tracing::warn!(
+                        component = %component_name,
+                        error = %e,
+                        "Failed to read footprint, skipping"
+                    );
                 }
             }
         }
@@ -87,29 +190,25 @@ impl PcbLib {
         // Reorder footprints according to FileHeader order (LIBREF{N} entries)
         // This ensures list_components returns components in the correct order
         // after reorder_components has been used.
-        for ole_name in &library.metadata.component_names {
+        let mut footprints = Vec::with_capacity(footprints_by_ole_name.len());
+        for ole_name in component_names {
             if let Some(footprint) = footprints_by_ole_name.remove(ole_name) {
-                library.footprints.push(footprint);
+                footprints.push(footprint);
             }
         }
 
         // Append any orphaned footprints (found in OLE but not in FileHeader)
         // This handles edge cases like corrupted FileHeader or manually edited files
-        for (ole_name, footprint) in footprints_by_ole_name {
+        for (ole_name, entry) in footprints_by_ole_name {
             tracing::warn!(
                 ole_name = %ole_name,
-                footprint = %footprint.name,
+                footprint = %entry.0.name,
                 "Footprint not found in FileHeader, appending at end"
             );
-            library.footprints.push(footprint);
+            footprints.push(entry);
         }
 
-        // Populate model_3d from component_bodies for backward compatibility
-        library.populate_model_3d_from_component_bodies();
-
-        tracing::info!(count = library.footprints.len(), "Read PcbLib");
-
-        Ok(library)
+        footprints
     }
 
     /// Populates `model_3d` field from `component_bodies` for backward compatibility.
@@ -176,9 +275,8 @@ impl PcbLib {
 
         // Try binary version string format first:
         // [string_len:4 LE u32][string_len:1 u8][string_data]
-        if data.len() >= 5 {
-            let block_len = u32::from_le_bytes([data[0], data[1], data[2], data[3]]) as usize;
-            let str_len = data[4] as usize;
+        if let (Some(block_len), Some(&str_len)) = (read_u32_le(&data, 0), data.get(4)) {
+            let (block_len, str_len) = (block_len as usize, usize::from(str_len));
 
             if block_len == str_len && data.len() >= 5 + str_len {
                 if let Ok(version) = std::str::from_utf8(&data[5..5 + str_len]) {
@@ -418,13 +516,13 @@ impl PcbLib {
         models
     }
 
-    /// Reads a single footprint from the OLE document.
-    fn read_footprint<F: std::io::Read + std::io::Seek>(
+    /// Reads a footprint's `Parameters` stream only: its canonical name
+    /// (`PATTERN`) and description, with no primitives.
+    fn read_footprint_header<F: std::io::Read + std::io::Seek>(
         cfb: &mut cfb::CompoundFile<F>,
         storage_path: &std::path::Path,
         name: &str,
-        wide_strings: &reader::WideStrings,
-    ) -> AltiumResult<Footprint> {
+    ) -> Footprint {
         let mut footprint = Footprint::new(name);
 
         // Read parameters if present
@@ -432,29 +530,128 @@ impl PcbLib {
         if let Some(params_data) = crate::altium::read_stream_opt(cfb, &params_path) {
             Self::parse_parameters(&mut footprint, &params_data);
         }
+        footprint
+    }
+
+    /// Reads a single footprint's `Parameters` and raw primitive streams from
+    /// the OLE document; the primitives are decoded by [`Self::parse_footprint`].
+    fn read_footprint<F: std::io::Read + std::io::Seek>(
+        cfb: &mut cfb::CompoundFile<F>,
+        storage_path: &std::path::Path,
+        name: &str,
+    ) -> AltiumResult<(Footprint, FootprintStreams)> {
+        let footprint = Self::read_footprint_header(cfb, storage_path, name);
 
         // Read Data stream (contains primitives)
-        let data_path = storage_path.join("Data");
-        if cfb.is_stream(&data_path) {
-            let mut stream = cfb.open_stream(&data_path).map_err(|e| {
-                AltiumError::invalid_ole(format!("Failed to open Data stream: {e}"))
-            })?;
-            let mut data = Vec::new();
-            std::io::Read::read_to_end(&mut stream, &mut data).map_err(|e| {
+        let data = Self::open_data_stream(cfb, storage_path)?
+            .map(|mut stream| {
+                crate::altium::read_stream_to_end(&mut stream).map_err(|e| {
+                    AltiumError::invalid_ole(format!("Failed to read Data stream: {e}"))
+                })
+            })
+            .transpose()?;
+
+        // Read UniqueIDPrimitiveInformation stream if present (contains unique IDs for primitives)
+        let unique_id_path = storage_path.join("UniqueIDPrimitiveInformation/Data");
+        let unique_ids = crate::altium::read_stream_opt(cfb, &unique_id_path);
+
+        Ok((footprint, FootprintStreams { data, unique_ids }))
+    }
+
+    /// Reads a footprint's name for [`Self::read_names`], failing wherever
+    /// [`Self::read_footprint`] would: its `Data` stream is read through to
+    /// the end, but into a sink rather than a buffer.
+    fn read_footprint_name<F: std::io::Read + std::io::Seek>(
+        cfb: &mut cfb::CompoundFile<F>,
+        storage_path: &std::path::Path,
+        name: &str,
+    ) -> AltiumResult<(Footprint, ())> {
+        let footprint = Self::read_footprint_header(cfb, storage_path, name);
+
+        if let Some(mut stream) = Self::open_data_stream(cfb, storage_path)? {
+            std::io::copy(&mut stream, &mut std::io::sink()).map_err(|e| {
                 AltiumError::invalid_ole(format!("Failed to read Data stream: {e}"))
             })?;
+        }
+
+        Ok((footprint, ()))
+    }
 
-            Self::parse_primitives(&mut footprint, &data, wide_strings);
+    /// Opens a footprint's primitive `Data` stream, or `None` if it has none.
+    fn open_data_stream<F: std::io::Read + std::io::Seek>(
+        cfb: &mut cfb::CompoundFile<F>,
+        storage_path: &std::path::Path,
+    ) -> AltiumResult<Option<cfb::Stream<F>>> {
+        let data_path = storage_path.join("Data");
+        if !cfb.is_stream(&data_path) {
+            return Ok(None);
         }
+        cfb.open_stream(&data_path)
+            .map(Some)
+            .map_err(|e| AltiumError::invalid_ole(format!("Failed to open Data stream: {e}")))
+    }
 
-        // Read UniqueIDPrimitiveInformation stream if present (contains unique IDs for primitives)
-        let unique_id_path = storage_path.join("UniqueIDPrimitiveInformation/Data");
-        if let Some(uid_data) = crate::altium::read_stream_opt(cfb, &unique_id_path) {
-            let unique_ids = reader::parse_unique_id_stream(&uid_data);
-            reader::apply_unique_ids(&mut footprint, &unique_ids);
+    /// Returns how many threads to decode a library of `count` footprints on.
+    ///
+    /// Footprints are independent, so libraries large enough to amortise the
+    /// thread start-up use one thread per available core at most. Building
+    /// without the `parallel` feature, or a host reporting no usable
+    /// parallelism, keeps every footprint on the calling thread.
+    fn parse_threads(count: usize) -> usize {
+        let cores = if cfg!(feature = "parallel") {
+            std::thread::available_parallelism().map_or(1, std::num::NonZeroUsize::get)
+        } else {
+            1
+        };
+        Self::parse_threads_for(count, cores)
+    }
+
+    /// Splits `count` footprints over at most `cores` threads, giving each
+    /// thread at least [`MIN_FOOTPRINTS_PER_THREAD`] footprints (or 1 thread).
+    fn parse_threads_for(count: usize, cores: usize) -> usize {
+        cores.min(count / MIN_FOOTPRINTS_PER_THREAD).max(1)
+    }
+
+    /// Decodes each footprint's primitives from its raw streams on `threads`
+    /// scoped threads, each taking a contiguous chunk, and returns the
+    /// footprints in their original order.
+    fn parse_footprints(
+        mut footprints: Vec<(Footprint, FootprintStreams)>,
+        threads: usize,
+        wide_strings: &reader::WideStrings,
+    ) -> Vec<Footprint> {
+        let chunk_len = footprints.len().div_ceil(threads).max(1);
+        std::thread::scope(|scope| {
+            for chunk in footprints.chunks_mut(chunk_len) {
+                scope.spawn(move || {
+                    for (footprint, streams) in chunk {
+                        Self::parse_footprint(footprint, streams, wide_strings);
+                    }
+                });
+            }
+        });
+
+        footprints
+            .into_iter()
+            .map(|(footprint, _)| footprint)
+            .collect()
+    }
+
+    /// Decodes one footprint's primitives and unique IDs, releasing each raw
+    /// stream once it has been parsed.
+    fn parse_footprint(
+        footprint: &mut Footprint,
+        streams: &mut FootprintStreams,
+        wide_strings: &reader::WideStrings,
+    ) {
+        if let Some(data) = streams.data.take() {
+            Self::parse_primitives(footprint, &data, wide_strings);
         }
 
-        Ok(footprint)
+        if let Some(uid_data) = streams.unique_ids.take() {
+            let unique_ids = reader::parse_unique_id_stream(&uid_data);
+            reader::apply_unique_ids(footprint, &unique_ids);
+        }
     }
 
     /// Parses parameters from the Parameters stream.
@@ -473,19 +670,16 @@ impl PcbLib {
         // Detect whether stream has a 4-byte length header or is raw text.
         // With header: first 4 bytes are u32 LE length, followed by pipe-delimited text.
         // Raw text: starts directly with '|' character.
-        let text_data = if data.len() >= 4 {
-            let potential_len = u32::from_le_bytes([data[0], data[1], data[2], data[3]]) as usize;
+        let text_data = match read_u32_le(data, 0) {
             // Valid header if: length is plausible AND text would start with '|'
-            if potential_len > 0
-                && potential_len <= data.len().saturating_sub(4)
-                && data.get(4) == Some(&b'|')
+            Some(potential_len)
+                if potential_len > 0
+                    && potential_len as usize <= data.len().saturating_sub(4)
+                    && data.get(4) == Some(&b'|') =>
             {
                 &data[4..]
-            } else {
-                data
             }
-        } else {
-            data
+            _ => data,
         };
 
         // Altium stores parameter strings as Windows-1252, not UTF-8 (#68).
@@ -515,3 +709,83 @@ impl PcbLib {
         reader::parse_data_stream(footprint, data, Some(wide_strings));
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::altium::pcblib::{writer, Pad};
+
+    /// `count` footprints, the `i`th holding `i + 1` pads, as unparsed
+    /// name-only footprints with their encoded `Data` streams.
+    fn raw_footprints(count: usize) -> Vec<(Footprint, FootprintStreams)> {
+        (0..count)
+            .map(|i| {
+                let mut source = Footprint::new(format!("FP_{i}"));
+                for pad in 0..=i {
+                    source.add_pad(Pad::smd((pad + 1).to_string(), 0.0, 0.0, 0.5, 0.5));
+                }
+                let data = writer::encode_data_stream(&source).expect("encoding should succeed");
+                let streams = FootprintStreams {
+                    data: Some(data),
+                    unique_ids: None,
+                };
+                (Footprint::new(source.name), streams)
+            })
+            .collect()
+    }
+
+    #[test]
+    fn parse_footprints_keeps_order_across_uneven_chunks() {
+        // 10 footprints over 3 threads: chunks of 4, 4 and 2.
+        let footprints =
+            PcbLib::parse_footprints(raw_footprints(10), 3, &reader::WideStrings::new());
+
+        assert_eq!(footprints.len(), 10);
+        for (i, footprint) in footprints.iter().enumerate() {
+            assert_eq!(footprint.name, format!("FP_{i}"));
+            assert_eq!(footprint.pads.len(), i + 1, "pads of {}", footprint.name);
+        }
+    }
+
+    #[test]
+    fn parse_threads_requires_min_footprints_per_thread() {
+        const MIN: usize = MIN_FOOTPRINTS_PER_THREAD;
+
+        assert_eq!(PcbLib::parse_threads_for(0, 8), 1);
+        assert_eq!(PcbLib::parse_threads_for(MIN * 2 - 1, 8), 1);
+        assert_eq!(PcbLib::parse_threads_for(MIN * 2, 8), 2);
+        assert_eq!(PcbLib::parse_threads_for(MIN * 3 - 1, 8), 2);
+        assert_eq!(PcbLib::parse_threads_for(MIN * 100, 4), 4);
+        assert_eq!(PcbLib::parse_threads_for(MIN * 100, 1), 1);
+
+        // Whatever the host, a small library stays on the calling thread.
+        assert_eq!(PcbLib::parse_threads(MIN * 2 - 1), 1);
+    }
+
+    #[test]
+    fn footprint_storages_counts_only_footprints() {
+        // Each footprint carries a UniqueIDPrimitiveInformation storage, and
+        // the writer adds internal storages with their own `Data` streams.
+        let mut lib = PcbLib::new();
+        for i in 0..5 {
+            let mut footprint = Footprint::new(format!("FP_{i}"));
+            let mut pad = Pad::smd("1", 0.0, 0.0, 0.5, 0.5);
+            pad.unique_id = Some(format!("PADUID{i:02}"));
+            footprint.add_pad(pad);
+            lib.add(footprint);
+        }
+        let mut buffer = std::io::Cursor::new(Vec::new());
+        lib.write(&mut buffer).expect("write PcbLib");
+
+        buffer.set_position(0);
+        let cfb = cfb::CompoundFile::open(buffer).expect("open written PcbLib");
+        let mut names: Vec<_> = PcbLib::footprint_storages(&cfb)
+            .into_iter()
+            .map(|(_, name)| name)
+            .collect();
+        names.sort();
+
+        assert_eq!(names, ["FP_0", "FP_1", "FP_2", "FP_3", "FP_4"]);
+        assert_eq!(PcbLib::parse_threads(names.len()), 1);
+    }
+}
@@ -35,8 +35,9 @@ use super::primitives::{
 };
 use super::Footprint;
 use crate::altium::bytes::{
-    read_f64_le as read_f64, read_i16_le as read_i16, read_i32_le as read_i32,
-    read_u16_le as read_u16, read_u32_le as read_u32,
+    read_f64_le as read_f64, read_f64s_le as read_f64s, read_i16_le as read_i16,
+    read_i32_le as read_i32, read_i32s_le as read_i32s, read_u16_le as read_u16,
+    read_u32_le as read_u32,
 };
 use crate::altium::error::AltiumError;
 
@@ -94,7 +95,7 @@ pub fn parse_wide_strings(data: &[u8]) -> WideStrings {
     let mut strings = WideStrings::new();
 
     // WideStrings is pipe-delimited key=value pairs
-    let Ok(text) = String::from_utf8(data.to_vec()) else {
+    let Ok(text) = std::str::from_utf8(data) else {
         tracing::debug!("WideStrings stream is not valid UTF-8");
         return strings;
     };
@@ -202,14 +203,13 @@ pub fn parse_unique_id_stream(data: &[u8]) -> UniqueIdMap {
         let record_data = &data[offset..offset + record_len];
         offset += record_len;
 
-        // Parse the pipe-delimited record (strip trailing null terminators)
-        let trimmed = record_data
+        // Parse the pipe-delimited record in place (stop at the null terminator)
+        let text_len = record_data
             .iter()
-            .copied()
-            .take_while(|&b| b != 0x00)
-            .collect::<Vec<u8>>();
-        if let Ok(record_str) = String::from_utf8(trimmed) {
-            if let Some(entry) = parse_unique_id_record(&record_str) {
+            .position(|&b| b == 0x00)
+            .unwrap_or(record_data.len());
+        if let Ok(record_str) = std::str::from_utf8(&record_data[..text_len]) {
+            if let Some(entry) = parse_unique_id_record(record_str) {
                 tracing::trace!(
                     index = entry.primitive_index,
                     primitive_type = %entry.primitive_type,
@@ -334,10 +334,9 @@ use super::flags::{
 /// `FlagUnlocked` is inverted (a clear unlocked bit means the primitive is
 /// locked).
 fn read_flags(data: &[u8]) -> PcbFlags {
-    if data.len() < 3 {
+    let Some(bits) = read_u16(data, 1) else {
         return PcbFlags::empty();
-    }
-    let bits = u16::from_le_bytes([data[1], data[2]]);
+    };
     let mut flags = PcbFlags::empty();
     if bits & ALT_FLAG_UNLOCKED == 0 {
         flags |= PcbFlags::LOCKED;
@@ -577,119 +576,72 @@ pub fn parse_data_stream(
 
         offset += 1;
 
-        match record_type {
-            0x01 => {
-                // Arc
-                match parse_arc(data, offset) {
-                    Ok((arc, new_offset)) => {
-                        footprint.add_arc(arc);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Arc: {e}");
-                        break;
-                    }
-                }
-            }
-            0x02 => {
-                // Pad
-                match parse_pad(data, offset) {
-                    Ok((pad, new_offset)) => {
-                        footprint.add_pad(pad);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Pad: {e}");
-                        break;
-                    }
-                }
-            }
-            0x04 => {
-                // Track
-                match parse_track(data, offset) {
-                    Ok((track, new_offset)) => {
-                        footprint.add_track(track);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Track: {e}");
-                        break;
-                    }
-                }
-            }
-            0x05 => {
-                // Text
-                match parse_text(data, offset, wide_strings) {
-                    Ok((text, new_offset)) => {
-                        footprint.add_text(text);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Text: {e}");
-                        break;
-                    }
-                }
-            }
-            0x0B => {
-                // Region (filled polygon)
-                match parse_region(data, offset) {
-                    Ok((region, new_offset)) => {
-                        footprint.add_region(region);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Region: {e}");
-                        break;
-                    }
-                }
-            }
-            0x06 => {
-                // Fill (filled rectangle)
-                match parse_fill(data, offset) {
-                    Ok((fill, new_offset)) => {
-                        footprint.add_fill(fill);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Fill: {e}");
-                        break;
-                    }
-                }
-            }
-            0x0C => {
-                // ComponentBody (3D model reference)
-                match parse_component_body(data, offset) {
-                    Ok((body, new_offset)) => {
-                        footprint.add_component_body(body);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse ComponentBody: {e}");
-                        break;
-                    }
-                }
-            }
-            0x03 => {
-                // Via
-                match parse_via(data, offset) {
-                    Ok((via, new_offset)) => {
-                        footprint.add_via(via);
-                        offset = new_offset;
-                    }
-                    Err(e) => {
-                        tracing::debug!("Failed to parse Via: {e}");
-                        break;
-                    }
-                }
-            }
+        // Each arm parses one primitive, files it on the footprint and yields
+        // the offset of the next record; failures share one exit below.
+        let parsed = match record_type {
+            0x01 => parse_arc(data, offset).map(|(arc, next)| {
+                footprint.add_arc(arc);
+                next
+            }),
+            0x02 => parse_pad(data, offset).map(|(pad, next)| {
+                footprint.add_pad(pad);
+                next
+            }),
+            0x03 => parse_via(data, offset).map(|(via, next)| {
+                footprint.add_via(via);
+                next
+            }),
+            0x04 => parse_track(data, offset).map(|(track, next)| {
+                footprint.add_track(track);
+                next
+            }),
+            0x05 => parse_text(data, offset, wide_strings).map(|(text, next)| {
+                footprint.add_text(text);
+                next
+            }),
+            0x06 => parse_fill(data, offset).map(|(fill, next)| {
+                footprint.add_fill(fill);
+                next
+            }),
+            0x0B => parse_region(data, offset).map(|(region, next)| {
+                footprint.add_region(region);
+                next
+            }),
+            0x0C => parse_component_body(data, offset).map(|(body, next)| {
+                footprint.add_component_body(body);
+                next
+            }),
             _ => {
                 tracing::debug!("Unknown record type {record_type:#x} at offset {offset:#x}");
                 break;
             }
+        };
+
+        match parsed {
+            Ok(next) => offset = next,
+            Err(e) => {
+                tracing::debug!("Failed to parse {}: {e}", record_name(record_type));
+                break;
+            }
         }
     }
 }
 
+/// Display name of a `Data`-stream record type, for diagnostics.
+const fn record_name(record_type: u8) -> &'static str {
+    match record_type {
+        0x01 => "Arc",
+        0x02 => "Pad",
+        0x03 => "Via",
+        0x04 => "Track",
+        0x05 => "Text",
+        0x06 => "Fill",
+        0x0B => "Region",
+        0x0C => "ComponentBody",
+        _ => "unknown record",
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -720,6 +672,42 @@ mod tests {
         assert_eq!(s, "|&|0");
     }
 
+    #[test]
+    fn test_component_body_outline_clamps_truncated_count() {
+        // 18-byte header, a 1-byte (NUL-only) parameter block, then a count of 3
+        // followed by only two complete vertices and a stray partial one.
+        let mut block = vec![0u8; 18];
+        block.extend_from_slice(&1u32.to_le_bytes());
+        block.push(0x00);
+        block.extend_from_slice(&3u32.to_le_bytes());
+        for (x, y) in [(10_000.0f64, -20_000.0f64), (0.0, 30_000.0)] {
+            block.extend_from_slice(&x.to_le_bytes());
+            block.extend_from_slice(&y.to_le_bytes());
+        }
+        block.extend_from_slice(&[0xAA; 8]);
+
+        let outline = parse_component_body_outline(&block);
+        assert_eq!(outline.len(), 2);
+        assert!((outline[0].0 - 0.0254).abs() < 1e-9);
+        assert!((outline[0].1 + 0.0508).abs() < 1e-9);
+        assert!((outline[1].1 - 0.0762).abs() < 1e-9);
+    }
+
+    #[test]
+    fn test_component_body_param_text_stops_at_terminator() {
+        // Header bytes, the parameter C-string (one cp1252 byte: 0xB5 = µ), then
+        // outline bytes that happen to look like another `|KEY=VALUE` pair.
+        let mut block = vec![0u8; 18];
+        block.extend_from_slice(b"V7_LAYER=MECHANICAL1|NAME=10\xB5F\0");
+        block.extend_from_slice(b"|BOGUS=1");
+
+        assert_eq!(
+            component_body_param_text(&block),
+            "V7_LAYER=MECHANICAL1|NAME=10\u{00B5}F"
+        );
+        assert!(component_body_param_text(&[0u8; 24]).is_empty());
+    }
+
     #[test]
     fn test_layer_from_id() {
         // Copper layers
@@ -34,14 +34,9 @@ pub fn parse_model_data_stream(data: &[u8]) -> ModelIndex {
     let mut offset = 0usize;
     let mut stream_index = 0usize;
 
-    while offset + 4 <= data.len() {
-        // Read 4-byte little-endian record length
-        let record_len = u32::from_le_bytes([
-            data[offset],
-            data[offset + 1],
-            data[offset + 2],
-            data[offset + 3],
-        ]) as usize;
+    // Each record starts with a 4-byte little-endian length
+    while let Some(record_len) = read_u32(data, offset) {
+        let record_len = record_len as usize;
         offset += 4;
 
         if record_len == 0 || offset + record_len > data.len() {
@@ -56,8 +51,10 @@ pub fn parse_model_data_stream(data: &[u8]) -> ModelIndex {
 
         // Parse the record content as UTF-8 (or Latin-1 fallback)
         let record_data = &data[offset..offset + record_len];
-        let record_text = String::from_utf8(record_data.to_vec())
-            .unwrap_or_else(|_| record_data.iter().map(|&b| b as char).collect());
+        let record_text: std::borrow::Cow<'_, str> = std::str::from_utf8(record_data).map_or_else(
+            |_| record_data.iter().map(|&b| b as char).collect(),
+            std::borrow::Cow::Borrowed,
+        );
 
         // Extract ID (GUID) and NAME from the record
         let params = crate::altium::parse_pipe_params_raw(&record_text);
@@ -98,15 +95,15 @@ pub fn parse_model_data_stream(data: &[u8]) -> ModelIndex {
 ///
 /// The number of models in the library, or 0 if parsing fails.
 pub fn parse_model_header_stream(data: &[u8]) -> usize {
-    if data.len() < 4 {
+    let Some(count) = read_u32(data, 0) else {
         tracing::debug!(
             len = data.len(),
             "Models/Header stream too short (expected 4 bytes)"
         );
         return 0;
-    }
+    };
 
-    let count = u32::from_le_bytes([data[0], data[1], data[2], data[3]]) as usize;
+    let count = count as usize;
     tracing::debug!(count, "Parsed model count from Header stream");
     count
 }
@@ -22,6 +22,49 @@ fn read_common_indices(header: &[u8]) -> (u16, u16, i32) {
     (net_index, polygon_index, component_index)
 }
 
+/// Length of the `CommonPrimitiveData` header (offsets 0-12) that opens every
+/// primitive's geometry block; the primitive's own fields start right after.
+const COMMON_HEADER_LEN: usize = 13;
+
+/// The decoded `CommonPrimitiveData` header: layer @0, the Altium flag word
+/// @1-2 and the connectivity indices @3-8 (see [`read_common_indices`]).
+struct CommonHeader {
+    layer: Layer,
+    flags: PcbFlags,
+    net_index: u16,
+    polygon_index: u16,
+    component_index: i32,
+}
+
+/// Reads the [`CommonHeader`] of a primitive block. The caller has already
+/// checked the block is longer than the header.
+fn read_common_header(block: &[u8]) -> CommonHeader {
+    let (net_index, polygon_index, component_index) = read_common_indices(block);
+    CommonHeader {
+        layer: layer_from_id(block[0]),
+        flags: read_flags(block),
+        net_index,
+        polygon_index,
+        component_index,
+    }
+}
+
+/// Reads the `N` contiguous i32 fields that follow the common header (offset
+/// 13: location, size, ... depending on the primitive), converted to mm. `what`
+/// names the run in the parse error, reported at the run's stream offset given
+/// the block's `offset`.
+fn read_header_coords<const N: usize>(
+    block: &[u8],
+    offset: usize,
+    what: &str,
+) -> Result<[f64; N], AltiumError> {
+    read_i32s(block, COMMON_HEADER_LEN)
+        .map(|run| run.map(to_mm))
+        .ok_or_else(|| {
+            AltiumError::parse_error(offset + COMMON_HEADER_LEN, format!("failed to read {what}"))
+        })
+}
+
 /// Parses a Pad primitive.
 /// Returns the parsed `Pad` and the new offset on success.
 ///
@@ -101,36 +144,18 @@ pub(super) fn parse_pad(data: &[u8], offset: usize) -> ParseResult<Pad> {
         ));
     }
 
-    // Common header (13 bytes)
-    let layer_id = geometry[0];
-    let layer = layer_from_id(layer_id);
-    let flags = read_flags(geometry);
-    // Common-header connectivity indices @3-8 (net/polygon/component).
-    let (net_index, polygon_index, component_index) = read_common_indices(geometry);
-
-    // Location (X, Y) - offsets 13-20
-    let x =
-        to_mm(read_i32(geometry, 13).ok_or_else(|| {
-            AltiumError::parse_error(offset + 13, "failed to read Pad x coordinate")
-        })?);
-    let y =
-        to_mm(read_i32(geometry, 17).ok_or_else(|| {
-            AltiumError::parse_error(offset + 17, "failed to read Pad y coordinate")
-        })?);
-
-    // Size top (X, Y) - offsets 21-28
-    let size_top_x = to_mm(
-        read_i32(geometry, 21)
-            .ok_or_else(|| AltiumError::parse_error(offset + 21, "failed to read Pad width"))?,
-    );
-    let size_top_y = to_mm(
-        read_i32(geometry, 25)
-            .ok_or_else(|| AltiumError::parse_error(offset + 25, "failed to read Pad height"))?,
-    );
+    // Common header (13 bytes): layer, flags, connectivity indices @3-8.
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(geometry);
 
-    // Use top size for width/height
-    let width = size_top_x;
-    let height = size_top_y;
+    // Location (X, Y) and top size (X, Y) - one contiguous i32 run at offsets 13-28.
+    // The top size is used for width/height.
+    let [x, y, width, height] = read_header_coords(geometry, offset, "Pad location/size")?;
 
     // Hole size - offset 45
     let hole_size = if geometry.len() > 48 {
@@ -356,7 +381,9 @@ pub(super) fn parse_pad(data: &[u8], offset: usize) -> ParseResult<Pad> {
 fn guid_string_from_bytes(bytes: &[u8]) -> String {
     let array: [u8; 16] = bytes.try_into().expect("identity GUID is 16 bytes");
     let uuid = uuid::Uuid::from_bytes_le(array);
-    format!("{{{}}}", uuid.hyphenated().to_string().to_uppercase())
+    // `UpperHex` on the braced adapter encodes straight into the output string,
+    // with no lowercase intermediate to re-case.
+    format!("{:X}", uuid.braced())
 }
 
 /// Parses per-layer pad data from Block 5.
@@ -500,22 +527,8 @@ pub(super) fn parse_via(data: &[u8], offset: usize) -> ParseResult<Via> {
         ));
     }
 
-    let x = to_mm(
-        read_i32(block, 13)
-            .ok_or_else(|| AltiumError::parse_error(offset + 13, "failed to read Via x"))?,
-    );
-    let y = to_mm(
-        read_i32(block, 17)
-            .ok_or_else(|| AltiumError::parse_error(offset + 17, "failed to read Via y"))?,
-    );
-    let diameter = to_mm(
-        read_i32(block, 21)
-            .ok_or_else(|| AltiumError::parse_error(offset + 21, "failed to read Via diameter"))?,
-    );
-    let hole_size =
-        to_mm(read_i32(block, 25).ok_or_else(|| {
-            AltiumError::parse_error(offset + 25, "failed to read Via hole size")
-        })?);
+    // Location, diameter and hole size - one contiguous i32 run at offsets 13-28.
+    let [x, y, diameter, hole_size] = read_header_coords(block, offset, "Via geometry")?;
     let from_layer = layer_from_id(block[29]);
     let to_layer = layer_from_id(block[30]);
 
@@ -630,34 +643,17 @@ pub(super) fn parse_track(data: &[u8], offset: usize) -> ParseResult<Track> {
         ));
     }
 
-    // Common header (13 bytes)
-    let layer_id = block[0];
-    let layer = layer_from_id(layer_id);
-    let flags = read_flags(block);
-    // Common-header connectivity indices @3-8 (net/polygon/component).
-    let (net_index, polygon_index, component_index) = read_common_indices(block);
+    // Common header (13 bytes): layer, flags, connectivity indices @3-8.
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(block);
 
-    // Start coordinates (X, Y) - offsets 13-20
-    let x1 = to_mm(read_i32(block, 13).ok_or_else(|| {
-        AltiumError::parse_error(offset + 13, "failed to read Track x1 coordinate")
-    })?);
-    let y1 = to_mm(read_i32(block, 17).ok_or_else(|| {
-        AltiumError::parse_error(offset + 17, "failed to read Track y1 coordinate")
-    })?);
-
-    // End coordinates (X, Y) - offsets 21-28
-    let x2 = to_mm(read_i32(block, 21).ok_or_else(|| {
-        AltiumError::parse_error(offset + 21, "failed to read Track x2 coordinate")
-    })?);
-    let y2 = to_mm(read_i32(block, 25).ok_or_else(|| {
-        AltiumError::parse_error(offset + 25, "failed to read Track y2 coordinate")
-    })?);
-
-    // Width - offset 29
-    let width = to_mm(
-        read_i32(block, 29)
-            .ok_or_else(|| AltiumError::parse_error(offset + 29, "failed to read Track width"))?,
-    );
+    // Start (X, Y) @13-20, end (X, Y) @21-28 and width @29 - one contiguous i32 run.
+    let [x1, y1, x2, y2, width] = read_header_coords(block, offset, "Track geometry")?;
 
     // Extended tail (round-trip fidelity, #113): solder-mask expansion @35-38,
     // keepout restrictions @45. Kept `None` when absent or zero so a from-scratch
@@ -701,28 +697,17 @@ pub(super) fn parse_arc(data: &[u8], offset: usize) -> ParseResult<Arc> {
         ));
     }
 
-    // Common header (13 bytes)
-    let layer_id = block[0];
-    let layer = layer_from_id(layer_id);
-    let flags = read_flags(block);
-    // Common-header connectivity indices @3-8 (net/polygon/component).
-    let (net_index, polygon_index, component_index) = read_common_indices(block);
+    // Common header (13 bytes): layer, flags, connectivity indices @3-8.
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(block);
 
-    // Centre coordinates (X, Y) - offsets 13-20
-    let x =
-        to_mm(read_i32(block, 13).ok_or_else(|| {
-            AltiumError::parse_error(offset + 13, "failed to read Arc x coordinate")
-        })?);
-    let y =
-        to_mm(read_i32(block, 17).ok_or_else(|| {
-            AltiumError::parse_error(offset + 17, "failed to read Arc y coordinate")
-        })?);
-
-    // Radius - offset 21
-    let radius = to_mm(
-        read_i32(block, 21)
-            .ok_or_else(|| AltiumError::parse_error(offset + 21, "failed to read Arc radius"))?,
-    );
+    // Centre (X, Y) @13-20 and radius @21 - one contiguous i32 run.
+    let [x, y, radius] = read_header_coords(block, offset, "Arc geometry")?;
 
     // Angles (doubles) - offsets 25-40
     let start_angle = read_f64(block, 25).unwrap_or(0.0);
@@ -800,14 +785,16 @@ pub(super) fn parse_text(
         ));
     }
 
-    // Common header (13 bytes): layer at 0, Altium flag word at offsets 1-2.
-    let layer_id = geometry_block[0];
-    let layer = layer_from_id(layer_id);
-    // Decode the lock/tenting/keepout flag word like every other primitive does,
-    // rather than discarding it (the write side already encodes these correctly).
-    let flags = read_flags(geometry_block);
-    // Common-header connectivity indices @3-8 (net/polygon/component).
-    let (net_index, polygon_index, component_index) = read_common_indices(geometry_block);
+    // Common header (13 bytes): layer at 0, Altium flag word at offsets 1-2,
+    // connectivity indices @3-8. The flag word is decoded like every other
+    // primitive's rather than discarded (the write side already encodes it).
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(geometry_block);
 
     // The authoritative text kind lives at offset 160 in the 252-byte record
     // (0 = Stroke, 1 = TrueType, 2 = BarCode).
@@ -817,19 +804,8 @@ pub(super) fn parse_text(
         TextKind::Stroke
     };
 
-    // Position (X, Y) - offsets 13-20
-    let x = to_mm(read_i32(geometry_block, 13).ok_or_else(|| {
-        AltiumError::parse_error(offset + 13, "failed to read Text x coordinate")
-    })?);
-    let y = to_mm(read_i32(geometry_block, 17).ok_or_else(|| {
-        AltiumError::parse_error(offset + 17, "failed to read Text y coordinate")
-    })?);
-
-    // Height - offset 21
-    let height = to_mm(
-        read_i32(geometry_block, 21)
-            .ok_or_else(|| AltiumError::parse_error(offset + 21, "failed to read Text height"))?,
-    );
+    // Position (X, Y) @13-20 and height @21 - one contiguous i32 run.
+    let [x, y, height] = read_header_coords(geometry_block, offset, "Text geometry")?;
 
     // Stroke font ID - offset 25-26 (u16)
     // Only meaningful when kind is Stroke
@@ -1076,6 +1052,16 @@ pub(super) fn find_ascii_in_block(block: &[u8], pattern: &str) -> Option<usize>
         .find(|&i| &block[i..i + pattern_bytes.len()] == pattern_bytes)
 }
 
+/// Decodes a length-validated run of 16-byte `(f64 x, f64 y)` vertex records
+/// (internal units). Shared by the Region contour and `ComponentBody` outline
+/// readers, which bounds-check the whole run up front rather than per vertex.
+/// The iterator is exact-size, so collecting it allocates once.
+fn decode_vertex_run(run: &[u8]) -> impl ExactSizeIterator<Item = [f64; 2]> + '_ {
+    // Every chunk is exactly 16 bytes, so the read cannot fail.
+    run.chunks_exact(16)
+        .map(|vertex| read_f64s(vertex, 0).unwrap_or_default())
+}
+
 /// Parses a Region primitive (filled polygon).
 /// Returns the parsed `Region` and the new offset on success.
 ///
@@ -1103,13 +1089,15 @@ pub(super) fn find_ascii_in_block(block: &[u8], pattern: &str) -> Option<usize>
 /// Reads one count-prefixed vertex contour (`[u32 count][count x 16-byte (x, y)
 /// doubles]`) from `props_block` starting at `at`. Returns the vertices and the
 /// offset just past the contour. `label` names the contour in error messages and
-/// `offset` is the record's absolute base for error reporting.
+/// `offset` is the record's absolute base for error reporting. The label is
+/// only formatted when an error is actually built, so a well-formed region
+/// reads its holes without allocating a name for each one.
 #[allow(clippy::cast_possible_truncation)] // Altium coords fit in i32
 fn read_region_contour(
     props_block: &[u8],
     at: usize,
     offset: usize,
-    label: &str,
+    label: std::fmt::Arguments<'_>,
 ) -> Result<(Vec<Vertex>, usize), AltiumError> {
     let count = read_u32(props_block, at).ok_or_else(|| {
         AltiumError::parse_error(offset + at, format!("failed to read {label} count"))
@@ -1126,27 +1114,14 @@ fn read_region_contour(
         ));
     }
 
-    let mut contour = Vec::with_capacity(count);
-    for i in 0..count {
-        let base = data_offset + i * 16;
-        let x_internal = read_f64(props_block, base).ok_or_else(|| {
-            AltiumError::parse_error(
-                offset + base,
-                format!("failed to read {label} vertex {i} x"),
-            )
-        })?;
-        let y_internal = read_f64(props_block, base + 8).ok_or_else(|| {
-            AltiumError::parse_error(
-                offset + base + 8,
-                format!("failed to read {label} vertex {i} y"),
-            )
-        })?;
-        // Coordinates are doubles in internal units; quantise to mm.
-        contour.push(Vertex {
-            x: to_mm(x_internal.round() as i32),
-            y: to_mm(y_internal.round() as i32),
-        });
-    }
+    // The whole contour was length-checked above, so decode it in one pass over
+    // the validated slice. Coordinates are doubles in internal units; quantise to mm.
+    let contour = decode_vertex_run(&props_block[data_offset..end])
+        .map(|[x, y]| Vertex {
+            x: to_mm(x.round() as i32),
+            y: to_mm(y.round() as i32),
+        })
+        .collect();
     Ok((contour, end))
 }
 
@@ -1177,10 +1152,13 @@ pub(super) fn parse_region(data: &[u8], offset: usize) -> ParseResult<Region> {
 
     // Common header (13 bytes): @0 layer, @1-2 flags, @3-4 net index (u16),
     // @5-6 polygon index (u16), @7-8 component index (u16, 0xFFFF -> -1), @9-12 reserved.
-    let layer_id = props_block[0];
-    let layer = layer_from_id(layer_id);
-    let flags = read_flags(props_block);
-    let (net_index, polygon_index, component_index) = read_common_indices(props_block);
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(props_block);
 
     // @13 reserved | @14-15 hole_count (u16) | @16-17 reserved. The trailing hole
     // contours (if any) follow the outline. A no-hole region reports 0 here.
@@ -1224,16 +1202,24 @@ pub(super) fn parse_region(data: &[u8], offset: usize) -> ParseResult<Region> {
     }
 
     // Outline contour: count-prefixed vertices immediately after the param string.
-    let (vertices, mut next_offset) =
-        read_region_contour(props_block, vertex_offset, offset, "Region vertex")?;
+    let (vertices, mut next_offset) = read_region_contour(
+        props_block,
+        vertex_offset,
+        offset,
+        format_args!("Region vertex"),
+    )?;
 
     // Trailing hole contours follow the outline, each as `[u32 count][count*16B]`.
     // `hole_count` (read from @14) bounds the loop; the helper length-guards each
     // contour so a truncated block fails cleanly instead of over-reading.
     let mut holes = Vec::with_capacity(hole_count);
     for h in 0..hole_count {
-        let label = format!("Region hole {h}");
-        let (contour, end) = read_region_contour(props_block, next_offset, offset, &label)?;
+        let (contour, end) = read_region_contour(
+            props_block,
+            next_offset,
+            offset,
+            format_args!("Region hole {h}"),
+        )?;
         holes.push(contour);
         next_offset = end;
     }
@@ -1348,26 +1334,17 @@ pub(super) fn parse_fill(data: &[u8], offset: usize) -> ParseResult<Fill> {
         ));
     }
 
-    // Common header (13 bytes)
-    let layer_id = block[0];
-    let layer = layer_from_id(layer_id);
-    let flags = read_flags(block);
-    // Common-header connectivity indices @3-8 (net/polygon/component).
-    let (net_index, polygon_index, component_index) = read_common_indices(block);
+    // Common header (13 bytes): layer, flags, connectivity indices @3-8.
+    let CommonHeader {
+        layer,
+        flags,
+        net_index,
+        polygon_index,
+        component_index,
+    } = read_common_header(block);
 
-    // Coordinates at offset 13
-    let x1 = to_mm(read_i32(block, 13).ok_or_else(|| {
-        AltiumError::parse_error(offset + 13, "failed to read Fill x1 coordinate")
-    })?);
-    let y1 = to_mm(read_i32(block, 17).ok_or_else(|| {
-        AltiumError::parse_error(offset + 17, "failed to read Fill y1 coordinate")
-    })?);
-    let x2 = to_mm(read_i32(block, 21).ok_or_else(|| {
-        AltiumError::parse_error(offset + 21, "failed to read Fill x2 coordinate")
-    })?);
-    let y2 = to_mm(read_i32(block, 25).ok_or_else(|| {
-        AltiumError::parse_error(offset + 25, "failed to read Fill y2 coordinate")
-    })?);
+    // Corner coordinates - one contiguous i32 run at offsets 13-28.
+    let [x1, y1, x2, y2] = read_header_coords(block, offset, "Fill coordinates")?;
 
     // Rotation at offset 29
     let rotation = read_f64(block, 29)
@@ -1413,13 +1390,10 @@ pub(super) fn parse_component_body(data: &[u8], offset: usize) -> ParseResult<Co
     let outline = parse_component_body_outline(block0);
 
     // Parse block 0 to extract parameters
-    // Format: [header bytes][parameter_string]
+    // Format: [header bytes][parameter_string][outline]
     // Parameter string is pipe-separated key=value pairs starting with V7_LAYER=
-    // Altium stores these as Windows-1252, not UTF-8 (#68).
-    let block_str = crate::altium::decode_windows1252(block0);
-
-    // Find the parameter string (starts with V7_LAYER= or similar key)
-    let params = parse_component_body_params(&block_str);
+    let params_str = component_body_param_text(block0);
+    let params = crate::altium::parse_pipe_params_raw(&params_str);
 
     // Capture every key the typed model does NOT consume, in read order, so a
     // read-modify-write round-trips the body keys Altium writes but we do not model
@@ -1427,9 +1401,7 @@ pub(super) fn parse_component_body(data: &[u8], offset: usize) -> ParseResult<Co
     // extrusion range, the repeated ARCRESOLUTION, CAVITYHEIGHT, ...). The writer
     // re-emits these verbatim after its canonical key set. The modelled keys are
     // exactly those backed by a ComponentBody struct field.
-    let additional_parameters = block_str.find("V7_LAYER").map_or_else(Vec::new, |start| {
-        capture_additional_params(&block_str[start..], BODY_MODELLED_PARAM_KEYS)
-    });
+    let additional_parameters = capture_additional_params(&params_str, BODY_MODELLED_PARAM_KEYS);
 
     // Extract key values
     let model_id = params.get("MODELID").cloned().unwrap_or_default();
@@ -1612,30 +1584,39 @@ pub(super) fn parse_component_body_outline(block0: &[u8]) -> Vec<(f64, f64)> {
     let Some(param_len) = read_u32(block0, HEADER_LEN) else {
         return Vec::new();
     };
-    let mut off = HEADER_LEN + 4 + param_len as usize;
+    let off = HEADER_LEN + 4 + param_len as usize;
 
     let Some(count) = read_u32(block0, off) else {
         return Vec::new();
     };
-    off += 4;
-
-    let mut outline = Vec::new();
-    for _ in 0..count {
-        let (Some(x), Some(y)) = (read_f64(block0, off), read_f64(block0, off + 8)) else {
-            break;
-        };
-        off += 16;
-        outline.push((x * INTERNAL_UNITS_TO_MM, y * INTERNAL_UNITS_TO_MM));
-    }
-    outline
+    let off = off + 4;
+
+    // `count` is untrusted: clamp it to the vertices actually present so a
+    // truncated outline keeps its complete leading vertices (and a corrupt count
+    // cannot drive an oversized allocation), then decode the run in one pass.
+    let count = (count as usize).min((block0.len() - off) / 16);
+    decode_vertex_run(&block0[off..off + count * 16])
+        .map(|[x, y]| (x * INTERNAL_UNITS_TO_MM, y * INTERNAL_UNITS_TO_MM))
+        .collect()
 }
 
-/// Parses key=value parameters from a `ComponentBody` block string.
-pub(super) fn parse_component_body_params(s: &str) -> std::collections::HashMap<String, String> {
-    // Parameters begin at the first `V7_LAYER=` key (after the binary header).
-    s.find("V7_LAYER")
-        .map(|start| crate::altium::parse_pipe_params_raw(&s[start..]))
-        .unwrap_or_default()
+/// Extracts the parameter text of a `ComponentBody` block: from the first
+/// `V7_LAYER` key (after the binary header) up to the NUL terminator, or empty
+/// when the block has no parameters.
+///
+/// Only that span is decoded. The header and the outline vertices that follow
+/// the terminator are binary and can dwarf the text, so decoding the whole
+/// block wasted work on bytes that are never parsed; worse, any `|` or `=` in
+/// them could surface as a bogus trailing key. Altium stores the text as
+/// Windows-1252, not UTF-8 (#68), and the `V7_LAYER` search can run on the raw
+/// bytes because that code page maps every ASCII byte to itself.
+pub(super) fn component_body_param_text(block0: &[u8]) -> String {
+    let Some(start) = block0.windows(8).position(|w| w == b"V7_LAYER") else {
+        return String::new();
+    };
+    let params = &block0[start..];
+    let end = params.iter().position(|&b| b == 0).unwrap_or(params.len());
+    crate::altium::decode_windows1252(&params[..end])
 }
 
 /// Parses a value in mils (e.g., "15.748mil") to mm.
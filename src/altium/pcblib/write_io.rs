@@ -139,7 +139,7 @@ impl PcbLib {
             // Embed: read the STEP file, then create the EmbeddedModel +
             // ComponentBody (shared by the fresh-embed and re-embed cases above).
             let step_data = std::fs::read(path).map_err(|e| AltiumError::file_read(path, e))?;
-            let guid = format!("{{{}}}", Uuid::new_v4().to_string().to_uppercase());
+            let guid = format!("{:X}", Uuid::new_v4().braced());
             let filename = path.file_name().map_or_else(
                 || "model.step".to_string(),
                 |n| n.to_string_lossy().to_string(),
@@ -390,9 +390,9 @@ impl PcbLib {
         Self::write_meta_storage(cfb, "/Library/LayerKindMapping", 1, &lkm)?;
 
         // PadViaLibrary: empty cache with a fresh library id.
-        let guid = Uuid::new_v4().to_string().to_uppercase();
+        let guid = Uuid::new_v4().braced();
         let pvl = Self::param_block(&format!(
-            "|PADVIALIBRARY.LIBRARYID={{{guid}}}|PADVIALIBRARY.LIBRARYNAME=<Local>|PADVIALIBRARY.DISPLAYUNITS=1"
+            "|PADVIALIBRARY.LIBRARYID={guid:X}|PADVIALIBRARY.LIBRARYNAME=<Local>|PADVIALIBRARY.DISPLAYUNITS=1"
         ));
         Self::write_meta_storage(cfb, "/Library/PadViaLibrary", 0, &pvl)?;
 
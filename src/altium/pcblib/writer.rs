@@ -1552,7 +1552,7 @@ fn build_component_body_params(body: &ComponentBody) -> String {
     // Model reference. Extruded bodies have no model file but still need a model
     // GUID, so synthesize one when the caller didn't supply it.
     let model_id = if extruded && body.model_id.is_empty() {
-        format!("{{{}}}", uuid::Uuid::new_v4().to_string().to_uppercase())
+        format!("{:X}", uuid::Uuid::new_v4().braced())
     } else {
         body.model_id.clone()
     };
@@ -1884,14 +1884,23 @@ pub fn encode_component_wide_strings(footprint: &Footprint) -> Vec<u8> {
     // pipe per entry and NO trailing pipe (matching AltiumSharp). With no entries the
     // string is empty, so the stream is just `[01 00 00 00][00]` — AltiumSharp's empty
     // form — rather than the spurious `[02 00 00 00][7C 00]` (leading-pipe) we emitted.
-    let mut content = String::new();
+    //
+    // Each byte's decimal code is written straight into `content` (at most
+    // "255," per byte) instead of a `String` per byte plus a joined copy.
+    let mut content = String::with_capacity(
+        texts
+            .iter()
+            .map(|text| "|ENCODEDTEXT=".len() + 4 + text.len() * 4)
+            .sum(),
+    );
     for (index, text) in texts.iter().enumerate() {
-        let encoded: String = text
-            .bytes()
-            .map(|b| b.to_string())
-            .collect::<Vec<_>>()
-            .join(",");
-        let _ = write!(content, "|ENCODEDTEXT{index}={encoded}");
+        let _ = write!(content, "|ENCODEDTEXT{index}=");
+        for (i, b) in text.bytes().enumerate() {
+            if i > 0 {
+                content.push(',');
+            }
+            let _ = write!(content, "{b}");
+        }
     }
 
     // Block format: [block_len:4][content + \x00] (length includes the null).
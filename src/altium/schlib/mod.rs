@@ -115,9 +115,9 @@ impl SchLib {
     /// Returns an error if the file cannot be opened or parsed.
     pub fn open(path: impl AsRef<Path>) -> AltiumResult<Self> {
         let path = path.as_ref();
-        let file = std::fs::File::open(path).map_err(|e| AltiumError::file_read(path, e))?;
+        let reader = crate::altium::read_file_to_cursor(path)?;
 
-        let mut lib = Self::read(file)?;
+        let mut lib = Self::read(reader)?;
         lib.filepath = Some(path.display().to_string());
         Ok(lib)
     }
@@ -7,6 +7,8 @@ use std::collections::HashMap;
 use std::io::{Read, Seek};
 use tracing::warn;
 
+use crate::altium::bytes::read_u32_le;
+
 use super::{pin_aux, reader, storage, AltiumError, AltiumResult, SchLib, Symbol};
 
 impl SchLib {
@@ -39,15 +41,17 @@ impl SchLib {
                 }
             };
 
-            let mut data = Vec::new();
-            if let Err(e) = stream.read_to_end(&mut data) {
-                warn!(
-                    component = %comp_name,
-                    error = %e,
-                    "Failed to read component data, skipping"
-                );
-                continue;
-            }
+            let data = match crate::altium::read_stream_to_end(&mut stream) {
+                Ok(data) => data,
+                Err(e) => {
+                    warn!(
+                        component = %comp_name,
+                        error = %e,
+                        "Failed to read component data, skipping"
+                    );
+                    continue;
+                }
+            };
 
             let mut symbol = Symbol::new(&comp_name);
             symbol.description = header
@@ -121,11 +125,9 @@ fn read_file_header<R: Read + Seek>(cfb: &mut CompoundFile<R>) -> AltiumResult<F
         .ok_or_else(|| AltiumError::missing_stream("FileHeader"))?;
 
     // Parse header: [length:4 LE][pipe-delimited key=value pairs]
-    if data.len() < 4 {
-        return Err(AltiumError::parse_error(0, "FileHeader too short"));
-    }
-
-    let length = u32::from_le_bytes([data[0], data[1], data[2], data[3]]) as usize;
+    let length = read_u32_le(&data, 0)
+        .ok_or_else(|| AltiumError::parse_error(0, "FileHeader too short"))?
+        as usize;
     if data.len() < 4 + length {
         return Err(AltiumError::parse_error(4, "FileHeader truncated"));
     }
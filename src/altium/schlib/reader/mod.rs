@@ -26,9 +26,7 @@ use super::primitives::{
     ShapeDisplayFlags, Text, TextFrame, TextJustification,
 };
 use super::Symbol;
-use crate::altium::bytes::{
-    read_i16_le as read_i16, read_i32_le as read_i32, read_u32_le as read_u32,
-};
+use crate::altium::bytes::{read_i16_le as read_i16, read_u32_le as read_u32};
 use std::collections::HashMap;
 
 mod parsers;
@@ -36,36 +34,65 @@ mod parsers;
 #[allow(clippy::wildcard_imports)] // tightly-coupled reader split
 use parsers::*;
 
-/// Parses primitives from a `SchLib` Data stream.
-pub fn parse_data_stream(symbol: &mut Symbol, data: &[u8]) {
-    if data.len() < 4 {
-        tracing::warn!("Data stream too short");
-        return;
+/// Mask for the payload length in a record's 32-bit size word (low 24 bits);
+/// the high byte is the record flag.
+const RECORD_LENGTH_MASK: u32 = 0x00FF_FFFF;
+
+/// Iterator over the `[u24 length LE][u8 flag]` records of a `SchLib` Data
+/// stream, yielding `(offset, flag, payload)` for each one.
+///
+/// Each header is decoded with a single 32-bit read and split with a mask and
+/// a shift, rather than reassembled byte by byte. Iteration ends at the end
+/// of the stream, at a zero-length record (treated defensively as an end
+/// marker) or at a record whose payload runs past the end of the stream.
+struct Records<'a> {
+    data: &'a [u8],
+    offset: usize,
+}
+
+impl<'a> Records<'a> {
+    const fn new(data: &'a [u8]) -> Self {
+        Self { data, offset: 0 }
     }
+}
 
-    let mut offset = 0;
+impl<'a> Iterator for Records<'a> {
+    type Item = (usize, u8, &'a [u8]);
 
-    // Parse records until end marker or end of data
-    while offset + 4 <= data.len() {
-        // Read header: Altium's [u24 length LE][u8 flags]. For records under
-        // 16 MiB (always, in practice) the third length byte is 0, so this also
-        // reads our older [u16 length LE][u16 BE type] frames identically.
-        let record_length =
-            u32::from_le_bytes([data[offset], data[offset + 1], data[offset + 2], 0]) as usize;
-        let record_type = u16::from(data[offset + 3]);
+    fn next(&mut self) -> Option<Self::Item> {
+        let offset = self.offset;
+        // For records under 16 MiB (always, in practice) the third length byte
+        // is 0, so this also reads our older [u16 length LE][u16 BE type]
+        // frames identically.
+        let word = read_u32(self.data, offset)?;
+        let record_length = (word & RECORD_LENGTH_MASK) as usize;
+        #[allow(clippy::cast_possible_truncation)] // the high byte of the word
+        let flag = (word >> 24) as u8;
 
         if record_length == 0 {
             // End marker
-            break;
+            return None;
         }
 
-        if offset + 4 + record_length > data.len() {
+        let start = offset + 4;
+        let Some(payload) = self.data.get(start..start + record_length) else {
             tracing::warn!("Record extends beyond data at offset {offset:#x}");
-            break;
-        }
+            return None;
+        };
 
-        let record_data = &data[offset + 4..offset + 4 + record_length];
+        self.offset = start + record_length;
+        Some((offset, flag, payload))
+    }
+}
 
+/// Parses primitives from a `SchLib` Data stream.
+pub fn parse_data_stream(symbol: &mut Symbol, data: &[u8]) {
+    if data.len() < 4 {
+        tracing::warn!("Data stream too short");
+        return;
+    }
+
+    for (offset, record_type, record_data) in Records::new(data) {
         match record_type {
             0 => {
                 // Text record (pipe-delimited key=value)
@@ -81,8 +108,6 @@ pub fn parse_data_stream(symbol: &mut Symbol, data: &[u8]) {
                 tracing::debug!("Unknown record type {record_type:#x} at offset {offset:#x}");
             }
         }
-
-        offset += 4 + record_length;
     }
 }
 
@@ -96,17 +121,15 @@ fn parse_text_record(symbol: &mut Symbol, data: &[u8]) {
     // the whole record as Windows-1252 so the UTF-8 value arrives as deterministic
     // one-char-per-byte "mojibake"; the field parser then re-decodes it as UTF-8
     // (see `decode_utf8_param_value`). Without the `%UTF8%` marker the record is
-    // decoded exactly as before: UTF-8 when valid, else Windows-1252.
-    let text = if contains_utf8_marker(data) {
-        crate::altium::decode_windows1252(data)
+    // decoded exactly as before: UTF-8 when valid (borrowed, no copy), else
+    // Windows-1252.
+    let text: std::borrow::Cow<'_, str> = if contains_utf8_marker(data) {
+        crate::altium::decode_windows1252(data).into()
     } else {
         std::str::from_utf8(data).map_or_else(
-            |_| {
-                // Decode as Windows-1252 (legacy Altium encoding)
-                let (decoded, _, _) = encoding_rs::WINDOWS_1252.decode(data);
-                decoded.into_owned()
-            },
-            str::to_string,
+            // Decode as Windows-1252 (legacy Altium encoding)
+            |_| encoding_rs::WINDOWS_1252.decode(data).0,
+            std::borrow::Cow::Borrowed,
         )
     };
 
@@ -361,6 +384,25 @@ const fn justification_from_id(id: u8) -> TextJustification {
 mod tests {
     use super::*;
 
+    #[test]
+    fn records_split_size_word_and_stop_at_zero_length() {
+        // An Altium [u24 len][u8 flag] pin frame, one of our older
+        // [u16 len LE][u16 BE type] text frames, then a zero-length end marker
+        // followed by bytes that must not be read.
+        let mut data = vec![0x02, 0x00, 0x00, 0x01, 0xAA, 0xBB];
+        data.extend_from_slice(&[0x03, 0x00, 0x00, 0x00, b'|', b'A', b'=']);
+        data.extend_from_slice(&[0x00, 0x00, 0x00, 0x00, 0xFF]);
+
+        let records: Vec<_> = Records::new(&data).collect();
+        assert_eq!(
+            records,
+            vec![(0, 1, &[0xAA, 0xBB][..]), (6, 0, &b"|A="[..])]
+        );
+
+        // A payload running past the stream ends iteration without yielding it.
+        assert_eq!(Records::new(&[0x09, 0x00, 0x00, 0x00, 0x01]).count(), 0);
+    }
+
     #[test]
     fn partcount_one_decodes_to_zero_no_floor() {
         // Altium stores count+1, so a single-part symbol stores PartCount=1 => internal
@@ -4,54 +4,68 @@
 #[allow(clippy::wildcard_imports)] // tightly-coupled reader split
 use super::*;
 
+/// Length of the fixed pin-record prefix: record type (i32), an unknown byte,
+/// `owner_part_id` (i16), display mode (u8) and the four symbol bytes.
+const PIN_PREFIX_LEN: usize = 12;
+
+/// Fixed pin-record fields after the description, in on-disk order:
+/// formal type (u8), electrical type (u8), flags (u8), length (i16),
+/// location X and Y (i16 each) and colour (u32). Each entry is the byte offset
+/// just past that field; the last is the run's total length.
+const PIN_TAIL_FIELD_ENDS: [usize; 7] = [1, 2, 3, 5, 7, 9, 13];
+
+/// Defaults for the pin tail run when a legacy/short record stops early:
+/// formal type 1, electrical type 4 (passive), length 10, everything else 0.
+const PIN_TAIL_DEFAULTS: [u8; 13] = [1, 4, 0, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0];
+
+/// Copies the fixed pin tail starting at `offset` into a stack array.
+///
+/// One bounds check covers the whole run. A record truncated inside the run
+/// keeps only the fields it holds in full; every missing field comes from
+/// [`PIN_TAIL_DEFAULTS`], as it would if each field were read on its own.
+fn read_pin_tail(data: &[u8], offset: usize) -> [u8; 13] {
+    let available = data.get(offset..).unwrap_or_default();
+    let whole = PIN_TAIL_FIELD_ENDS
+        .iter()
+        .rev()
+        .copied()
+        .find(|&end| end <= available.len())
+        .unwrap_or(0);
+    let mut tail = PIN_TAIL_DEFAULTS;
+    tail[..whole].copy_from_slice(&available[..whole]);
+    tail
+}
+
 /// Parses a binary pin record.
 pub(super) fn parse_binary_pin(data: &[u8]) -> Option<Pin> {
     if data.len() < 20 {
         return None;
     }
 
-    let mut offset = 0;
-
-    // record type (4 bytes) - should be 2 for pin
-    let _record_type = read_i32(data, offset)?;
-    offset += 4;
-
-    // unknown byte
-    offset += 1;
-
-    // owner_part_id (2 bytes)
-    let owner_part_id = read_i16(data, offset)?;
-    offset += 2;
-
-    // owner_part_display_mode (1 byte): the pin's own alternate-view index,
-    // stored in the binary record (AltiumSharp reads it here). Preserved so a
-    // pin authored on a non-default display mode round-trips; the golden pins
-    // carry 0, so a from-scratch pin stays byte-identical.
-    let owner_part_display_mode = i32::from(data.get(offset).copied().unwrap_or(0));
-    offset += 1;
-
-    // symbol flags (4 bytes: inner_edge, outer_edge, inside, outside)
-    let symbol_inner_edge = PinSymbol::from_id(data.get(offset).copied().unwrap_or(0));
-    let symbol_outer_edge = PinSymbol::from_id(data.get(offset + 1).copied().unwrap_or(0));
-    let symbol_inside = PinSymbol::from_id(data.get(offset + 2).copied().unwrap_or(0));
-    let symbol_outside = PinSymbol::from_id(data.get(offset + 3).copied().unwrap_or(0));
-    offset += 4;
+    // Fixed prefix, read as one run: record type (4 bytes, 2 for a pin), an
+    // unknown byte, owner_part_id (2 bytes), then owner_part_display_mode and
+    // the symbol flags (inner_edge, outer_edge, inside, outside).
+    //
+    // owner_part_display_mode is the pin's own alternate-view index, stored in
+    // the binary record (AltiumSharp reads it here). Preserved so a pin
+    // authored on a non-default display mode round-trips; the golden pins carry
+    // 0, so a from-scratch pin stays byte-identical.
+    let prefix: [u8; PIN_PREFIX_LEN] = data.get(..PIN_PREFIX_LEN)?.try_into().ok()?;
+    let owner_part_id = read_i16(&prefix, 5)?;
+    let [.., display_mode, inner_edge, outer_edge, inside, outside] = prefix;
+    let owner_part_display_mode = i32::from(display_mode);
+    let symbol_inner_edge = PinSymbol::from_id(inner_edge);
+    let symbol_outer_edge = PinSymbol::from_id(outer_edge);
+    let symbol_inside = PinSymbol::from_id(inside);
+    let symbol_outside = PinSymbol::from_id(outside);
 
     // description: Pascal short string [length:1][string]
-    let (description, next) = crate::altium::framing::read_pascal_string(data, offset);
-    offset = next;
-
-    // formal_type (1 byte): preserved on round-trip (Altium emits 1).
-    let formal_type = data.get(offset).copied().unwrap_or(1);
-    offset += 1;
+    let (description, next) = crate::altium::framing::read_pascal_string(data, PIN_PREFIX_LEN);
 
-    // electrical_type (1 byte)
-    let electrical_type = data.get(offset).copied().unwrap_or(4);
-    offset += 1;
-
-    // flags (1 byte)
-    let flags = data.get(offset).copied().unwrap_or(0);
-    offset += 1;
+    // Fixed tail run; formal_type is preserved on round-trip (Altium emits 1).
+    let tail = read_pin_tail(data, next);
+    let [formal_type, electrical_type, flags, ..] = tail;
+    let offset = next + PIN_TAIL_DEFAULTS.len();
 
     let rotated = (flags & 0x01) != 0;
     let flipped = (flags & 0x02) != 0;
@@ -61,19 +75,11 @@ pub(super) fn parse_binary_pin(data: &[u8]) -> Option<Pin> {
     let graphically_locked = (flags & 0x40) != 0;
     let is_not_accessible = (flags & 0x20) != 0;
 
-    // length (2 bytes)
-    let length = i32::from(read_i16(data, offset).unwrap_or(10));
-    offset += 2;
-
-    // location X, Y (2 bytes each, signed)
-    let x = i32::from(read_i16(data, offset).unwrap_or(0));
-    offset += 2;
-    let y = i32::from(read_i16(data, offset).unwrap_or(0));
-    offset += 2;
-
-    // colour (4 bytes)
-    let colour = read_u32(data, offset).unwrap_or(0);
-    offset += 4;
+    // length, then location X, Y (2 bytes each, signed), then colour (4 bytes)
+    let length = i32::from(read_i16(&tail, 3)?);
+    let x = i32::from(read_i16(&tail, 5)?);
+    let y = i32::from(read_i16(&tail, 7)?);
+    let colour = read_u32(&tail, 9)?;
 
     // name: [length:1][string]
     let (name, next) = crate::altium::framing::read_pascal_string(data, offset);
@@ -959,6 +965,24 @@ mod tests {
         );
     }
 
+    #[test]
+    fn pin_tail_truncated_mid_field_defaults_missing_fields() {
+        // 12-byte prefix, empty description, then a tail cut off inside
+        // Location.Y: the whole fields read, Y and colour fall back to 0.
+        let mut data = vec![2, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0];
+        data.push(0); // description length
+        data.extend_from_slice(&[3, 4, 0x04]); // formal, electrical, flags (hidden)
+        data.extend_from_slice(&30i16.to_le_bytes()); // length
+        data.extend_from_slice(&(-7i16).to_le_bytes()); // Location.X
+        data.push(0xFF); // first byte of Location.Y only
+
+        let pin = parse_binary_pin(&data).unwrap();
+        assert_eq!(pin.formal_type, 3);
+        assert!(pin.hidden);
+        assert_eq!((pin.length, pin.x, pin.y, pin.colour), (30, -7, 0, 0));
+        assert!(pin.name.is_empty() && pin.designator.is_empty());
+    }
+
     #[test]
     fn pin_owner_part_display_mode_default_byte_is_zero() {
         // Byte-identity: a from-scratch pin must leave the OwnerPartDisplayMode
@@ -8,9 +8,10 @@
 
 use serde::{Deserialize, Deserializer, Serialize, Serializer};
 
-/// Rounds a value to 6 decimal places.
+/// Rounds a value to 6 decimal places. Also the rounding step of `PcbLib`'s
+/// `units::to_mm`, so parsed and serialised coordinates share one definition.
 #[inline]
-fn round(value: f64) -> f64 {
+pub(crate) fn round(value: f64) -> f64 {
     (value * 1_000_000.0).round() / 1_000_000.0
 }
 
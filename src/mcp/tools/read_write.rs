@@ -1946,13 +1946,13 @@ impl McpServer {
             .map(str::to_lowercase);
 
         match extension.as_deref() {
-            Some("pcblib") => match PcbLib::open(filepath) {
-                Ok(library) => {
-                    let total_count = library.len();
-
-                    // Apply pagination and optionally include metadata
-                    let components: Vec<Value> = if include_metadata {
-                        library
+            Some("pcblib") => {
+                // A names-only listing reads each footprint's Parameters and
+                // drains its Data stream (so the same footprints are listed),
+                // but the primitives are only decoded for metadata.
+                let listing = if include_metadata {
+                    PcbLib::open(filepath).map(|library| {
+                        let components: Vec<Value> = library
                             .iter()
                             .skip(offset)
                             .take(limit.unwrap_or(usize::MAX))
@@ -1968,42 +1968,50 @@ impl McpServer {
                                     "has_3d_model": fp.model_3d.is_some() || !fp.component_bodies.is_empty(),
                                 })
                             })
-                            .collect()
-                    } else {
-                        library
-                            .names()
+                            .collect();
+                        (library.len(), components)
+                    })
+                } else {
+                    PcbLib::open_names(filepath).map(|names| {
+                        let total_count = names.len();
+                        let components: Vec<Value> = names
                             .into_iter()
                             .skip(offset)
                             .take(limit.unwrap_or(usize::MAX))
                             .map(|n| json!(n))
-                            .collect()
-                    };
-
-                    let returned_count = components.len();
-                    let has_more = offset + returned_count < total_count;
+                            .collect();
+                        (total_count, components)
+                    })
+                };
 
-                    let result = json!({
-                        "status": "success",
-                        "filepath": filepath,
-                        "file_type": "PcbLib",
-                        "total_count": total_count,
-                        "returned_count": returned_count,
-                        "offset": offset,
-                        "has_more": has_more,
-                        "include_metadata": include_metadata,
-                        "components": components,
-                    });
-                    ToolCallResult::text(serde_json::to_string_pretty(&result).unwrap())
-                }
-                Err(e) => {
-                    let result = json!({
-                        "status": "error",
-                        "filepath": filepath,
-                        "error": e.to_string(),
-                    });
-                    ToolCallResult::error(serde_json::to_string_pretty(&result).unwrap())
+                match listing {
+                    Ok((total_count, components)) => {
+                        let returned_count = components.len();
+                        let has_more = offset + returned_count < total_count;
+
+                        let result = json!({
+                            "status": "success",
+                            "filepath": filepath,
+                            "file_type": "PcbLib",
+                            "total_count": total_count,
+                            "returned_count": returned_count,
+                            "offset": offset,
+                            "has_more": has_more,
+                            "include_metadata": include_metadata,
+                            "components": components,
+                        });
+                        ToolCallResult::text(serde_json::to_string_pretty(&result).unwrap())
+                    }
+                    Err(e) => {
+                        let result = json!({
+                            "status": "error",
+                            "filepath": filepath,
+                            "error": e.to_string(),
+                        });
+                        ToolCallResult::error(serde_json::to_string_pretty(&result).unwrap())
+                    }
                 }
-            },
+            }
             Some("schlib") => match SchLib::open(filepath) {
                 Ok(library) => {
                     let total_count = library.len();
@@ -3016,6 +3024,45 @@ mod tests {
             assert_eq!(p["has_more"], true);
         }
 
+        #[test]
+        fn list_components_pcblib_names_only_matches_metadata_listing() {
+            let dir = test_temp_dir();
+            let server = create_test_server(dir.path());
+            let path = dir.path().join("L.PcbLib");
+            create_test_pcblib(&path);
+
+            let names = server.call_list_components(&json!({
+                "filepath": path.to_string_lossy(),
+            }));
+            let p = parse_result_json(&names);
+            assert_eq!(p["file_type"], "PcbLib");
+            assert_eq!(p["include_metadata"], false);
+            assert_eq!(p["total_count"], 2);
+            assert_eq!(p["components"], json!(["CHIP_0402", "CHIP_0603"]));
+
+            // The names-only read lists exactly what the full read does
+            let meta = server.call_list_components(&json!({
+                "filepath": path.to_string_lossy(), "include_metadata": true,
+            }));
+            let m = parse_result_json(&meta);
+            assert_eq!(m["total_count"], p["total_count"]);
+            let meta_names: Vec<_> = m["components"]
+                .as_array()
+                .expect("components array")
+                .iter()
+                .map(|c| c["name"].clone())
+                .collect();
+            assert_eq!(json!(meta_names), p["components"]);
+
+            let paged = server.call_list_components(&json!({
+                "filepath": path.to_string_lossy(), "limit": 1, "offset": 1,
+            }));
+            let p = parse_result_json(&paged);
+            assert_eq!(p["components"], json!(["CHIP_0603"]));
+            assert_eq!(p["returned_count"], 1);
+            assert_eq!(p["has_more"], false);
+        }
+
         #[test]
         fn list_components_schlib_metadata() {
             let dir = test_temp_dir();
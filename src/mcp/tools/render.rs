@@ -255,21 +255,12 @@ impl McpServer {
             footprint.tracks.len(),
             footprint.arcs.len()
         );
-        output.push_str(&"-".repeat(canvas_width + 2));
-        output.push('\n');
-
-        for row in &canvas {
-            output.push('|');
-            for &ch in row {
-                output.push(ch);
-            }
-            output.push('|');
-            output.push('\n');
-        }
-
-        output.push_str(&"-".repeat(canvas_width + 2));
-        output.push('\n');
-        output.push_str("Legend: # = pad, - = track, o = arc, + = origin\n");
+        write_framed_canvas(
+            &mut output,
+            &canvas,
+            canvas_width,
+            "Legend: # = pad, - = track, o = arc, + = origin\n",
+        );
 
         output
     }
@@ -738,25 +729,43 @@ impl McpServer {
             output,
             "Pins: {pin_count}, Rectangles: {rect_count}, Lines: {line_count}"
         );
-        output.push_str(&"-".repeat(canvas_width + 2));
-        output.push('\n');
-
-        for row in &canvas {
-            output.push('|');
-            for &ch in row {
-                output.push(ch);
-            }
-            output.push('|');
-            output.push('\n');
-        }
+        write_framed_canvas(
+            &mut output,
+            &canvas,
+            canvas_width,
+            "Legend: |-+ = rectangle, ~ = pin line, o = arc, O = ellipse, + = origin\n",
+        );
 
-        output.push_str(&"-".repeat(canvas_width + 2));
-        output.push('\n');
         output
-            .push_str("Legend: |-+ = rectangle, ~ = pin line, o = arc, O = ellipse, + = origin\n");
+    }
+}
 
-        output
+/// Appends a rendered canvas to `output`: a rule, one `|row|` line per
+/// canvas row, a closing rule and then `legend`.
+///
+/// The whole frame is reserved up front, so a large canvas is copied into
+/// `output` in one allocation rather than regrowing it row by row.
+fn write_framed_canvas(
+    output: &mut String,
+    canvas: &[Vec<char>],
+    canvas_width: usize,
+    legend: &str,
+) {
+    let rule_len = canvas_width + 2;
+    // Each line is the rule width plus a newline; glyphs are ASCII apart
+    // from designator text, which at worst costs one more reallocation.
+    output.reserve((rule_len + 1) * (canvas.len() + 2) + legend.len());
+
+    output.extend(std::iter::repeat('-').take(rule_len));
+    output.push('\n');
+    for row in canvas {
+        output.push('|');
+        output.extend(row);
+        output.push_str("|\n");
     }
+    output.extend(std::iter::repeat('-').take(rule_len));
+    output.push('\n');
+    output.push_str(legend);
 }
 
 #[cfg(test)]
@@ -51,21 +51,32 @@ where
     Ok(Some(line))
 }
 
-/// Writes a single JSON message line to an async writer, terminated by a
-/// newline and flushed. Per the MCP spec a message must not contain embedded
-/// newlines.
-async fn write_message_line<W>(writer: &mut W, json: &str) -> io::Result<()>
+/// Serialises `message` to a single newline-terminated JSON line.
+///
+/// The terminator is appended to the serialisation buffer itself, so each
+/// message goes out as one write instead of a body write plus a `\n` write.
+/// Compact `serde_json` output escapes newlines inside strings, so the only
+/// `\n` in the line is the terminator.
+fn encode_message_line<T: serde::Serialize>(message: &T) -> io::Result<Vec<u8>> {
+    let mut line =
+        serde_json::to_vec(message).map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
+    line.push(b'\n');
+    Ok(line)
+}
+
+/// Writes a single framed message line (see [`encode_message_line`]) to an
+/// async writer in one write and flushes it. Per the MCP spec a message must
+/// not contain embedded newlines.
+async fn write_message_line<W>(writer: &mut W, line: &[u8]) -> io::Result<()>
 where
     W: AsyncWrite + Unpin,
 {
     debug_assert!(
-        !json.contains('\n'),
-        "JSON message must not contain embedded newlines"
+        line.iter().position(|&b| b == b'\n') == Some(line.len().wrapping_sub(1)),
+        "JSON message must end in its only newline"
     );
-    writer.write_all(json.as_bytes()).await?;
-    writer.write_all(b"\n").await?;
-    writer.flush().await?;
-    Ok(())
+    writer.write_all(line).await?;
+    writer.flush().await
 }
 
 /// A stdio-based MCP transport.
@@ -124,10 +135,7 @@ impl StdioTransport {
     ///
     /// Returns an error if serialisation or writing fails.
     pub async fn write_response(&mut self, response: &JsonRpcResponse) -> io::Result<()> {
-        let json = serde_json::to_string(response)
-            .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-
-        self.write_raw(&json).await
+        self.write_line(&encode_message_line(response)?).await
     }
 
     /// Writes a JSON-RPC error to stdout.
@@ -136,10 +144,7 @@ impl StdioTransport {
     ///
     /// Returns an error if serialisation or writing fails.
     pub async fn write_error(&mut self, error: &JsonRpcError) -> io::Result<()> {
-        let json = serde_json::to_string(error)
-            .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-
-        self.write_raw(&json).await
+        self.write_line(&encode_message_line(error)?).await
     }
 
     /// Writes a JSON-RPC notification to stdout.
@@ -153,30 +158,25 @@ impl StdioTransport {
         &mut self,
         notification: &OutgoingNotification,
     ) -> io::Result<()> {
-        let json = serde_json::to_string(notification)
-            .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-
-        self.write_raw(&json).await
+        self.write_line(&encode_message_line(notification)?).await
     }
 
-    /// Writes a raw JSON string to stdout with newline termination.
+    /// Writes an already-framed message line to stdout.
     ///
     /// # Errors
     ///
     /// Returns an error if writing fails.
-    async fn write_raw(&mut self, json: &str) -> io::Result<()> {
+    async fn write_line(&mut self, line: &[u8]) -> io::Result<()> {
         #[cfg(test)]
         if let Some(sink) = &self.test_sink {
-            // Mirror write_message_line's framing (message + single '\n') without
-            // holding the lock across an await point.
-            let mut framed = json.as_bytes().to_vec();
-            framed.push(b'\n');
+            // The line is already framed; copy it in without holding the lock
+            // across an await point.
             sink.lock()
                 .expect("test sink mutex poisoned")
-                .extend_from_slice(&framed);
+                .extend_from_slice(line);
             return Ok(());
         }
-        write_message_line(&mut self.writer, json).await
+        write_message_line(&mut self.writer, line).await
     }
 
     /// Writes an arbitrary JSON value to stdout.
@@ -187,10 +187,7 @@ impl StdioTransport {
     ///
     /// Returns an error if serialisation or writing fails.
     pub async fn write_json(&mut self, value: &serde_json::Value) -> io::Result<()> {
-        let json = serde_json::to_string(value)
-            .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-
-        self.write_raw(&json).await
+        self.write_line(&encode_message_line(value)?).await
     }
 }
 
@@ -279,10 +276,17 @@ mod tests {
     #[tokio::test]
     async fn write_message_line_appends_single_newline() {
         let mut buf: Vec<u8> = Vec::new();
-        write_message_line(&mut buf, r#"{"a":1}"#).await.unwrap();
+        let line = encode_message_line(&serde_json::json!({"a": 1})).unwrap();
+        write_message_line(&mut buf, &line).await.unwrap();
         assert_eq!(buf, b"{\"a\":1}\n");
     }
 
+    #[test]
+    fn encode_message_line_escapes_embedded_newlines() {
+        let line = encode_message_line(&serde_json::json!({"text": "a\nb"})).unwrap();
+        assert_eq!(line, b"{\"text\":\"a\\nb\"}\n");
+    }
+
     /// Decodes the single framed line captured in a test sink.
     fn sink_json(sink: &std::sync::Arc<std::sync::Mutex<Vec<u8>>>) -> serde_json::Value {
         let bytes = sink.lock().unwrap().clone();
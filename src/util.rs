@@ -109,6 +109,10 @@ pub fn generate_unique_id() -> String {
 
     static COUNTER: AtomicU64 = AtomicU64::new(0);
 
+    // A const table indexed directly, rather than a `Vec<char>` rebuilt on
+    // every call (the writer asks for one id per primitive).
+    const ALPHABET: &[u8; 26] = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ";
+
     let time_seed = SystemTime::now()
         .duration_since(UNIX_EPOCH)
         .map_or(0, |d| d.as_nanos());
@@ -117,13 +121,12 @@ pub fn generate_unique_id() -> String {
     let counter = COUNTER.fetch_add(1, Ordering::Relaxed);
     let seed = time_seed.wrapping_add(u128::from(counter).wrapping_mul(0x9E37_79B9_7F4A_7C15));
 
-    let chars: Vec<char> = "ABCDEFGHIJKLMNOPQRSTUVWXYZ".chars().collect();
     let mut id = String::with_capacity(8);
     let mut n = seed;
     for _ in 0..8 {
         #[allow(clippy::cast_possible_truncation)]
         let idx = (n % 26) as usize;
-        id.push(chars[idx]);
+        id.push(char::from(ALPHABET[idx]));
         n = n.wrapping_mul(1_103_515_245).wrapping_add(12345);
     }
     id
@@ -11,6 +11,7 @@ use altium_designer_mcp::altium::schlib::{
     Pin, PinElectricalType, PinOrientation, PinSymbol, Rectangle, SchLib, Symbol,
 };
 use std::fs::File;
+use std::io::{Read, Seek};
 use tempfile::TempDir;
 
 /// Creates a temporary directory inside `.tmp/` for test isolation.
@@ -121,6 +122,48 @@ fn pcblib_file_roundtrip_multiple_footprints() {
     assert!(read_lib.get("CHIP_1206").is_some());
 }
 
+#[test]
+fn pcblib_reads_footprint_with_differently_cased_data_stream() {
+    let temp_dir = test_temp_dir();
+    let file_path = temp_dir.path().join("test_data_case.PcbLib");
+
+    let mut lib = PcbLib::new();
+    for name in ["LOWER", "UPPER"] {
+        let mut fp = Footprint::new(name);
+        fp.add_pad(Pad::smd("1", -0.5, 0.0, 0.6, 0.5));
+        fp.add_pad(Pad::smd("2", 0.5, 0.0, 0.6, 0.5));
+        lib.add(fp);
+    }
+    lib.save(&file_path).expect("Failed to write PcbLib");
+
+    // Compound-file names are case-insensitive, so rename each footprint's
+    // primitive stream to a casing other than Altium's own `Data`.
+    {
+        let mut cfb = cfb::open_rw(&file_path).expect("open written PcbLib");
+        for (storage, stream_name) in [("LOWER", "data"), ("UPPER", "DATA")] {
+            let data_path = format!("/{storage}/Data");
+            let mut data = Vec::new();
+            std::io::Read::read_to_end(
+                &mut cfb.open_stream(&data_path).expect("open Data"),
+                &mut data,
+            )
+            .expect("read Data");
+            cfb.remove_stream(&data_path).expect("remove Data");
+            let mut stream = cfb
+                .create_stream(format!("/{storage}/{stream_name}"))
+                .expect("create renamed stream");
+            std::io::Write::write_all(&mut stream, &data).expect("write renamed stream");
+        }
+        cfb.flush().expect("flush PcbLib");
+    }
+
+    let read_lib = PcbLib::open(&file_path).expect("Failed to read PcbLib");
+    assert_eq!(read_lib.names(), vec!["LOWER", "UPPER"]);
+    for fp in read_lib.iter() {
+        assert_eq!(fp.pads.len(), 2, "Pads lost for {}", fp.name);
+    }
+}
+
 #[test]
 fn pcblib_file_roundtrip_all_primitives() {
     let temp_dir = test_temp_dir();
@@ -809,6 +852,156 @@ fn pcblib_file_roundtrip_reorder_preserved() {
     );
 }
 
+// =============================================================================
+// Names-only Read Tests
+// =============================================================================
+
+/// An in-memory file whose reads fail wherever they touch `poison`, standing
+/// in for a corrupt sector inside one stream.
+struct PoisonedReader {
+    inner: std::io::Cursor<Vec<u8>>,
+    poison: std::ops::Range<u64>,
+}
+
+impl Read for PoisonedReader {
+    fn read(&mut self, buf: &mut [u8]) -> std::io::Result<usize> {
+        let start = self.inner.position();
+        let end = start + buf.len() as u64;
+        if start < self.poison.end && self.poison.start < end {
+            return Err(std::io::Error::other("poisoned sector"));
+        }
+        self.inner.read(buf)
+    }
+}
+
+impl Seek for PoisonedReader {
+    fn seek(&mut self, pos: std::io::SeekFrom) -> std::io::Result<u64> {
+        self.inner.seek(pos)
+    }
+}
+
+#[test]
+fn pcblib_names_only_read_skips_unreadable_footprint() {
+    let temp_dir = test_temp_dir();
+    let file_path = temp_dir.path().join("test_unreadable.PcbLib");
+
+    // BROKEN gets enough pads for its Data stream to outgrow the mini stream,
+    // so its bytes sit in sectors no other stream shares.
+    let mut lib = PcbLib::new();
+    for (name, pads) in [("GOOD_A", 2), ("BROKEN", 64), ("GOOD_B", 2)] {
+        let mut fp = Footprint::new(name);
+        for pad in 0..pads {
+            let designator = if name == "BROKEN" {
+                format!("BROKEN_PAD_{pad}")
+            } else {
+                (pad + 1).to_string()
+            };
+            fp.add_pad(Pad::smd(designator, 0.0, 0.0, 0.5, 0.5));
+        }
+        lib.add(fp);
+    }
+    lib.save(&file_path).expect("Failed to write PcbLib");
+
+    let bytes = std::fs::read(&file_path).expect("Failed to read PcbLib bytes");
+    let marker = b"BROKEN_PAD_";
+    let at = bytes
+        .windows(marker.len())
+        .position(|window| window == marker)
+        .expect("BROKEN's pad designators should be in its Data stream") as u64;
+    let poisoned = || PoisonedReader {
+        inner: std::io::Cursor::new(bytes.clone()),
+        poison: at..at + marker.len() as u64,
+    };
+
+    // The full read and the names-only read drop the same footprint
+    let read_lib = PcbLib::read(poisoned()).expect("Failed to read PcbLib");
+    assert_eq!(read_lib.names(), vec!["GOOD_A", "GOOD_B"]);
+    let names = PcbLib::read_names(poisoned()).expect("Failed to read PcbLib names");
+    assert_eq!(names, read_lib.names());
+}
+
+#[test]
+fn pcblib_names_only_read_appends_footprint_missing_from_header() {
+    let temp_dir = test_temp_dir();
+    let file_path = temp_dir.path().join("test_orphan.PcbLib");
+    let extra_path = temp_dir.path().join("test_orphan_source.PcbLib");
+
+    let mut lib = PcbLib::new();
+    for name in ["ALPHA", "BETA"] {
+        let mut fp = Footprint::new(name);
+        fp.add_pad(Pad::smd("1", 0.0, 0.0, 0.5, 0.5));
+        lib.add(fp);
+    }
+    lib.save(&file_path).expect("Failed to write PcbLib");
+
+    let mut extra = PcbLib::new();
+    let mut orphan = Footprint::new("ORPHAN");
+    for pad in 0..3 {
+        orphan.add_pad(Pad::smd((pad + 1).to_string(), 0.0, 0.0, 0.5, 0.5));
+    }
+    extra.add(orphan);
+    extra
+        .save(&extra_path)
+        .expect("Failed to write source PcbLib");
+
+    // Graft ORPHAN's storage into the library without listing it in the
+    // FileHeader or Library/Data
+    {
+        let mut source = cfb::open(&extra_path).expect("open source PcbLib");
+        let mut target = cfb::open_rw(&file_path).expect("open written PcbLib");
+        target.create_storage("/ORPHAN").expect("create storage");
+        for stream_name in ["Parameters", "Data"] {
+            let path = format!("/ORPHAN/{stream_name}");
+            let mut data = Vec::new();
+            std::io::Read::read_to_end(
+                &mut source.open_stream(&path).expect("open source stream"),
+                &mut data,
+            )
+            .expect("read source stream");
+            let mut stream = target.create_stream(&path).expect("create stream");
+            std::io::Write::write_all(&mut stream, &data).expect("write stream");
+        }
+        target.flush().expect("flush PcbLib");
+    }
+
+    let read_lib = PcbLib::open(&file_path).expect("Failed to read PcbLib");
+    assert_eq!(read_lib.names(), vec!["ALPHA", "BETA", "ORPHAN"]);
+    assert_eq!(read_lib.get("ORPHAN").expect("orphan read").pads.len(), 3);
+
+    let names = PcbLib::open_names(&file_path).expect("Failed to read PcbLib names");
+    assert_eq!(names, read_lib.names());
+}
+
+#[test]
+fn pcblib_file_roundtrip_large_library_preserves_order_and_primitives() {
+    let temp_dir = test_temp_dir();
+    let file_path = temp_dir.path().join("test_large.PcbLib");
+
+    // Enough footprints for the read to split parsing across threads
+    let mut lib = PcbLib::new();
+    let names: Vec<String> = (0..64).rev().map(|i| format!("FP_{i:02}")).collect();
+    for (i, name) in names.iter().enumerate() {
+        let mut fp = Footprint::new(name);
+        for pad in 0..=i % 4 {
+            fp.add_pad(Pad::smd((pad + 1).to_string(), 0.0, 0.0, 0.5, 0.5));
+        }
+        lib.add(fp);
+    }
+
+    lib.save(&file_path).expect("Failed to write PcbLib");
+    let read_lib = PcbLib::open(&file_path).expect("Failed to read PcbLib");
+
+    assert_eq!(read_lib.names(), names);
+    for (i, fp) in read_lib.iter().enumerate() {
+        assert_eq!(
+            fp.pads.len(),
+            i % 4 + 1,
+            "Pad count mismatch for {}",
+            fp.name
+        );
+    }
+}
+
 #[test]
 fn schlib_file_roundtrip_pin_symbols_and_colour() {
     let temp_dir = test_temp_dir();